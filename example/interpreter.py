@@ -1,22 +1,155 @@
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional
 from src.parser import ASTNode
 from src.semantic_analyzer import SemanticAnalyzer
+from src.symbols import SymbolTable
+from src.sinks import OutputSink, StreamSink
+from src.runtime_io import InputReader
+
+try:
+    import numpy as np
+except ImportError:  # без numpy доступны только скалярные переменные
+    np = None
+
+# Как часто (в итерациях циклов) сверяться с часами при заданном ограничении времени
+DEADLINE_CHECK_INTERVAL = 1024
+
+# Типы элементов массивов
+ARRAY_DTYPES = {'int': 'int64', 'float': 'float64', 'bool': 'bool'}
+
+def new_array(var_type: str, size: int):
+    """
+    Массив из size элементов, заполненный нулями
+    """
+    if np is None:
+        raise RuntimeError("Для работы с массивами требуется пакет numpy")
+    return np.zeros(size, dtype=ARRAY_DTYPES[var_type])
+
+def array_index(array, index) -> int:
+    """
+    Проверка индекса элемента массива (нумерация с нуля)
+    """
+    position = int(index)
+    if position != index or not 0 <= position < len(array):
+        raise IndexError(f"Индекс {index} вне границ массива из {len(array)} элементов")
+    return position
+
+class BudgetExceeded(Exception):
+    """
+    Программа превысила допустимое число итераций циклов или время выполнения
+    """
+    def __init__(self, reason: str, steps: int, line: int, column: int,
+                 variable_values: Dict[str, Any]):
+        self.reason = reason  # 'steps' или 'time'
+        self.steps = steps
+        self.line = line
+        self.column = column
+        self.variable_values = variable_values
+        limit = 'число шагов' if reason == 'steps' else 'время выполнения'
+        super().__init__(f"Превышено допустимое {limit}: {steps} итераций, "
+                         f"цикл на строке {line}, позиция {column}")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'reason': self.reason,
+            'steps': self.steps,
+            'line': self.line,
+            'column': self.column,
+        }
 
 class Interpreter:
-    def __init__(self, symbol_table: Dict[str, Dict]):
+    def __init__(self, symbol_table: Dict[int, Dict], symbols: SymbolTable,
+                 max_steps: Optional[int] = None, time_limit: Optional[float] = None,
+                 output: OutputSink = None, reader: InputReader = None):
         self.symbol_table = symbol_table
-        self.variable_values: Dict[str, Any] = {}
+        self.symbols = symbols
+        # Приёмник вывода write() и writeln; по умолчанию - буферизованный стандартный вывод
+        self.output = output if output is not None else StreamSink()
+        # Ввод readln; по умолчанию стандартный ввод открывается при первом readln
+        self.reader = reader
+        # Значения переменных по номерам имён
+        self.variable_values: Dict[int, Any] = {}
+        # Переменные-массивы: присваивание им заполняет существующий массив
+        self.arrays = {identifier for identifier, entry in symbol_table.items() if entry.get('size')}
+        # Ограничения: число итераций всех циклов и время выполнения в секундах
+        self.max_steps = max_steps
+        self.time_limit = time_limit
+        self.steps = 0
+        self.deadline = None
+        self.next_check = None
+        self.start_budget()
+
+    def start_budget(self):
+        """
+        Сброс счётчика шагов и отсчёта времени
+        """
+        self.steps = 0
+        self.deadline = (time.monotonic() + self.time_limit
+                         if self.time_limit is not None else None)
+        self.next_check = self.next_budget_check()
+
+    def next_budget_check(self) -> float:
+        """
+        Номер шага, на котором нужно снова проверить ограничения
+        """
+        next_check = float('inf')
+        if self.max_steps is not None:
+            next_check = self.max_steps + 1
+        if self.deadline is not None:
+            next_check = min(next_check, self.steps + DEADLINE_CHECK_INTERVAL)
+        return next_check
+
+    def check_budget(self, loop: ASTNode):
+        """
+        Проверка ограничений на обратной дуге цикла.
+        Вызывается только когда счётчик шагов достиг next_check
+        """
+        reason = None
+        if self.max_steps is not None and self.steps > self.max_steps:
+            reason = 'steps'
+        elif self.deadline is not None and time.monotonic() > self.deadline:
+            reason = 'time'
+
+        if reason:
+            raise BudgetExceeded(reason, self.steps, loop.value.get('line'),
+                                 loop.value.get('column'), self.named_values())
+        self.next_check = self.next_budget_check()
 
     def interpret(self, ast: ASTNode):
         """
         Интерпретация абстрактного синтаксического дерева
         """
-        semantic_analyzer = SemanticAnalyzer(self.symbol_table)
+        self.start_budget()
+        semantic_analyzer = SemanticAnalyzer(self.symbol_table, self.symbols)
         
         # Продолжаем интерпретацию даже при наличии предупреждений
         semantic_analyzer.analyze(ast)
         
-        self.execute_node(ast)
+        try:
+            self.execute_node(ast)
+        finally:
+            self.output.flush()
+
+    def named_values(self) -> Dict[str, Any]:
+        """
+        Значения переменных по именам (для вывода результатов)
+        """
+        name = self.symbols.name
+        return {name(symbol): value for symbol, value in self.variable_values.items()}
+
+    # Точки наблюдения за выполнением: ничего не делают и переопределяются
+    # интерпретатором с трассой (TracingInterpreter из src.trace)
+
+    def on_statement(self, node: ASTNode):
+        """
+        Начало выполнения условного оператора, цикла, write() или writeln
+        """
+
+    def on_assign(self, node: ASTNode, identifier: int, value: Any, position: Optional[int] = None):
+        """
+        Присваивание оператором node (счетчику цикла for - самим циклом) или чтение readln;
+        position - индекс элемента массива, value у массива целиком - массив или скаляр заполнения
+        """
 
     def execute_node(self, node: ASTNode):
         """
@@ -47,7 +180,10 @@ class Interpreter:
                 'bool': False
             }
             
-            self.variable_values[identifier] = default_values.get(var_type)
+            if decl.value.get('size'):
+                self.variable_values[identifier] = new_array(var_type, decl.value['size'])
+            else:
+                self.variable_values[identifier] = default_values.get(var_type)
 
     def execute_statement(self, node: ASTNode):
         """
@@ -66,13 +202,46 @@ class Interpreter:
                 self.execute_statement(statement)
         elif node.type == 'WriteStatement':
             self.execute_write(node)
+        elif node.type == 'ReadStatement':
+            self.execute_read(node)
+        elif node.type == 'WriteLineStatement':
+            self.execute_writeln(node)
 
     def execute_write(self, node: ASTNode):
         """
         Выполнение оператора write()
         """
-        expression_value = self.evaluate_expression(node.children[0])
-        print(f"WRITE: {expression_value}")  # Базовая реализация вывода
+        self.on_statement(node)
+        self.output.write(self.evaluate_expression(node.children[0]))
+
+    def execute_writeln(self, node: ASTNode):
+        """
+        Выполнение оператора writeln: значения выводятся одной строкой
+        """
+        self.on_statement(node)
+        self.output.write_line([self.evaluate_expression(argument) for argument in node.children])
+
+    def execute_read(self, node: ASTNode):
+        """
+        Выполнение оператора readln: массив целиком читается одной пачкой значений
+        """
+        if self.reader is None:
+            self.reader = InputReader()
+        reader = self.reader
+        for target in node.children:
+            identifier = target.value
+            var_type = self.symbol_table[identifier]['type']
+            if target.type == 'Index':
+                array = self.variable_values[identifier]
+                position = array_index(array, self.evaluate_expression(target.children[0]))
+                value = array[position] = reader.read_value(var_type)
+                self.on_assign(node, identifier, value, position)
+            elif identifier in self.arrays:
+                reader.read_array(self.variable_values[identifier], var_type)
+                self.on_assign(node, identifier, self.variable_values[identifier])
+            else:
+                value = self.variable_values[identifier] = reader.read_value(var_type)
+                self.on_assign(node, identifier, value)
 
     def execute_assignment(self, node: ASTNode):
         """
@@ -80,12 +249,25 @@ class Interpreter:
         """
         identifier = node.value['identifier']
         expression_value = self.evaluate_expression(node.children[0])
-        self.variable_values[identifier] = expression_value
+        if len(node.children) > 1:
+            # Элемент массива
+            array = self.variable_values[identifier]
+            position = array_index(array, self.evaluate_expression(node.children[1]))
+            array[position] = expression_value
+            self.on_assign(node, identifier, expression_value, position)
+        elif identifier in self.arrays:
+            # Массив целиком: копирование поэлементно или заполнение скаляром
+            self.variable_values[identifier][...] = expression_value
+            self.on_assign(node, identifier, expression_value)
+        else:
+            self.variable_values[identifier] = expression_value
+            self.on_assign(node, identifier, expression_value)
 
     def execute_conditional(self, node: ASTNode):
         """
         Выполнение условного оператора
         """
+        self.on_statement(node)
         condition_result = self.evaluate_expression(node.children[0])
         
         if condition_result:
@@ -97,6 +279,7 @@ class Interpreter:
         """
         Выполнение цикла for
         """
+        self.on_statement(node)
         # Инициализация счетчика
         self.execute_statement(node.children[0])
         
@@ -106,6 +289,12 @@ class Interpreter:
         # Предел цикла
         limit = self.evaluate_expression(node.children[1])
         
+        self.run_for_iterations(node, counter_var, limit)
+
+    def run_for_iterations(self, node: ASTNode, counter_var: int, limit):
+        """
+        Итерации цикла for от текущего значения счетчика до предела включительно
+        """
         # Тело цикла
         body = node.children[2]
         
@@ -113,20 +302,31 @@ class Interpreter:
             self.execute_statement(body)
             # Инкремент счетчика
             self.variable_values[counter_var] += 1
+            self.on_assign(node, counter_var, self.variable_values[counter_var])
+
+            self.steps += 1
+            if self.steps >= self.next_check:
+                self.check_budget(node)
 
     def execute_while_loop(self, node: ASTNode):
         """
         Выполнение цикла while
         """
+        self.on_statement(node)
         condition = node.children[0]
         body = node.children[1]
         
         while self.evaluate_expression(condition):
             self.execute_statement(body)
 
+            self.steps += 1
+            if self.steps >= self.next_check:
+                self.check_budget(node)
+
     def evaluate_expression(self, node: ASTNode):
         """
-        Вычисление значения выражения
+        Вычисление значения выражения.
+        Операции над массивами выполняются numpy над всеми элементами сразу
         """
         if node.type == 'Number':
             return float(node.value)
@@ -134,6 +334,9 @@ class Interpreter:
             return node.value == 'true'
         elif node.type == 'Identifier':
             return self.variable_values.get(node.value)
+        elif node.type == 'Index':
+            array = self.variable_values[node.value]
+            return array.item(array_index(array, self.evaluate_expression(node.children[0])))
         elif node.type == 'Comparison':
             op = node.value['operator']
             left = self.evaluate_expression(node.children[0])
@@ -0,0 +1,760 @@
+import operator
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+from src.parser import ASTNode
+from src.symbols import SymbolTable
+from src.sinks import OutputSink, StreamSink
+from src.interpreter import BudgetExceeded, DEADLINE_CHECK_INTERVAL, array_index, new_array
+from src.runtime_io import InputReader
+
+class Temp(NamedTuple):
+    """
+    Временная переменная трёхадресного кода
+    """
+    index: int
+
+class Const(NamedTuple):
+    """
+    Константа; тип хранится отдельно, чтобы 1 и 1.0 не считались одним значением
+    """
+    value: Any
+    kind: type
+
+# Операнд: номер переменной программы (int), Temp или Const
+
+BINARY = {
+    'mult': operator.mul,
+    'div': operator.truediv,
+    'plus': operator.add,
+    'min': operator.sub,
+    'GT': operator.gt,
+    'LT': operator.lt,
+    'EQ': operator.eq,
+    'GE': operator.ge,
+    'LE': operator.le,
+    'NE': operator.ne,
+}
+
+# Операции, результат которых не зависит от порядка операндов
+COMMUTATIVE = {'mult', 'plus', 'EQ', 'NE'}
+
+DEFAULT_VALUES = {'int': 0, 'float': 0.0, 'bool': False}
+
+class Instruction:
+    """
+    Команда трёхадресного кода.
+    op - операция из BINARY, 'copy', 'write', 'branch' (условие; переходы в targets),
+    'jump' или 'halt'. У перехода по обратной дуге цикла loc - место цикла в тексте.
+    Массивы: 'alloc' (создание), 'load' (чтение элемента), 'store' (запись элемента)
+    и 'fill' (присваивание всему массиву). У 'store' и 'fill' массив - одновременно
+    dest и первый аргумент: команда меняет только часть значения.
+    Ввод-вывод: 'read' (значение типа args[0] в dest), 'read_array' (массив - dest
+    и первый аргумент, как у 'fill') и 'writeln' (все аргументы одной строкой)
+    """
+    __slots__ = ('op', 'dest', 'args', 'targets', 'loc')
+
+    def __init__(self, op: str, dest=None, args=(), targets=(), loc=None):
+        self.op = op
+        self.dest = dest
+        self.args = list(args)
+        self.targets = list(targets)
+        self.loc = loc
+
+class BasicBlock:
+    def __init__(self, label: int):
+        self.label = label
+        self.instructions: List[Instruction] = []
+
+    @property
+    def terminator(self) -> Optional[Instruction]:
+        if self.instructions and self.instructions[-1].op in ('branch', 'jump', 'halt'):
+            return self.instructions[-1]
+        return None
+
+    def successors(self) -> List[int]:
+        terminator = self.terminator
+        return list(terminator.targets) if terminator else []
+
+class Loop(NamedTuple):
+    preheader: int
+    header: int
+    end: int  # блоки цикла - с header по end - 1
+
+class IRProgram:
+    """
+    Программа в виде базовых блоков трёхадресного кода
+    """
+    def __init__(self, blocks: List[BasicBlock], loops: List[Loop], variables: Dict[int, Any],
+                 symbols: SymbolTable):
+        self.blocks = blocks
+        self.loops = loops
+        self.variables = variables  # объявленные переменные и их начальные значения
+        self.symbols = symbols
+        self.stats = {'cse': 0, 'copies': 0, 'dead': 0, 'hoisted': 0}
+
+    def operand_name(self, operand) -> str:
+        if isinstance(operand, Temp):
+            return f"%{operand.index}"
+        if isinstance(operand, Const):
+            return repr(operand.value)
+        return self.symbols.name(operand)
+
+    def dump(self) -> str:
+        """
+        Текстовое представление программы
+        """
+        name = self.operand_name
+        headers = {loop.header: loop for loop in self.loops}
+        lines = []
+        for block in self.blocks:
+            comment = f"    ; заголовок цикла, предзаголовок B{headers[block.label].preheader}" \
+                if block.label in headers else ""
+            lines.append(f"B{block.label}:{comment}")
+            for instruction in block.instructions:
+                op, args = instruction.op, [name(arg) for arg in instruction.args]
+                if op == 'copy':
+                    text = f"{name(instruction.dest)} = {args[0]}"
+                elif op == 'alloc':
+                    text = f"{name(instruction.dest)} = alloc {instruction.args[0].value}[{args[1]}]"
+                elif op == 'load':
+                    text = f"{name(instruction.dest)} = {args[0]}[{args[1]}]"
+                elif op == 'store':
+                    text = f"{args[0]}[{args[1]}] = {args[2]}"
+                elif op == 'fill':
+                    text = f"{args[0]}[...] = {args[1]}"
+                elif op in BINARY:
+                    text = f"{name(instruction.dest)} = {args[0]} {op} {args[1]}"
+                elif op == 'write':
+                    text = f"write {args[0]}"
+                elif op == 'read':
+                    text = f"{name(instruction.dest)} = read {instruction.args[0].value}"
+                elif op == 'read_array':
+                    text = f"{args[0]}[...] = read {instruction.args[1].value}"
+                elif op == 'writeln':
+                    text = f"writeln {', '.join(args)}"
+                elif op == 'branch':
+                    text = f"branch {args[0]} ? B{instruction.targets[0]} : B{instruction.targets[1]}"
+                elif op == 'jump':
+                    text = f"jump B{instruction.targets[0]}"
+                    if instruction.loc:
+                        text += f"    ; обратная дуга, строка {instruction.loc[0]}"
+                else:
+                    text = op
+                lines.append(f"    {text}")
+        return '\n'.join(lines)
+
+class IRBuilder:
+    """
+    Перевод AST в трёхадресный код
+    """
+    def __init__(self, symbols: SymbolTable):
+        self.symbols = symbols
+        self.blocks: List[BasicBlock] = []
+        self.loops: List[Loop] = []
+        self.variables: Dict[int, Any] = {}
+        self.types: Dict[int, str] = {}
+        self.arrays = set()
+        self.temp_count = 0
+        self.current: BasicBlock = None
+
+    def build(self, ast: ASTNode) -> IRProgram:
+        self.current = self.new_block()
+        for child in ast.children:
+            if child.type == 'VariableDeclarations':
+                for decl in child.children:
+                    identifier = decl.value['identifier']
+                    self.types[identifier] = decl.value['type']
+                    if decl.value.get('size'):
+                        self.variables[identifier] = None
+                        self.arrays.add(identifier)
+                        self.emit('alloc', identifier, [self.const(decl.value['type']),
+                                                        self.const(decl.value['size'])])
+                        continue
+                    default = DEFAULT_VALUES.get(decl.value['type'])
+                    self.variables[identifier] = default
+                    self.emit('copy', identifier, [self.const(default)])
+            elif child.type == 'StatementBlock':
+                for statement in child.children:
+                    self.lower_statement(statement)
+        self.emit('halt')
+        return IRProgram(self.blocks, self.loops, self.variables, self.symbols)
+
+    def new_block(self) -> BasicBlock:
+        block = BasicBlock(len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    def start_block(self, block: BasicBlock):
+        """
+        Переход к следующему блоку (с безусловным переходом в него, если текущий не завершён)
+        """
+        if self.current.terminator is None:
+            self.emit('jump', targets=[block.label])
+        self.current = block
+
+    def emit(self, op: str, dest=None, args=(), targets=(), loc=None) -> Instruction:
+        instruction = Instruction(op, dest, args, targets, loc)
+        self.current.instructions.append(instruction)
+        return instruction
+
+    def temp(self) -> Temp:
+        self.temp_count += 1
+        return Temp(self.temp_count)
+
+    def const(self, value) -> Const:
+        return Const(value, type(value))
+
+    def lower_statement(self, node: ASTNode):
+        if node.type == 'Assignment':
+            self.lower_assignment(node)
+        elif node.type == 'ConditionalStatement':
+            self.lower_conditional(node)
+        elif node.type == 'ForLoop':
+            self.lower_for_loop(node)
+        elif node.type == 'WhileLoop':
+            self.lower_while_loop(node)
+        elif node.type == 'Block':
+            for statement in node.children:
+                self.lower_statement(statement)
+        elif node.type == 'WriteStatement':
+            self.emit('write', args=[self.lower_expression(node.children[0])])
+        elif node.type == 'ReadStatement':
+            self.lower_read(node)
+        elif node.type == 'WriteLineStatement':
+            self.emit('writeln', args=[self.lower_expression(argument) for argument in node.children])
+
+    def lower_read(self, node: ASTNode):
+        for target in node.children:
+            identifier = target.value
+            var_type = self.const(self.types[identifier])
+            if target.type == 'Index':
+                index = self.lower_expression(target.children[0])
+                value = self.temp()
+                self.emit('read', value, [var_type])
+                self.emit('store', identifier, [identifier, index, value])
+            elif identifier in self.arrays:
+                self.emit('read_array', identifier, [identifier, var_type])
+            else:
+                self.emit('read', identifier, [var_type])
+
+    def lower_assignment(self, node: ASTNode):
+        identifier = node.value['identifier']
+        value = self.lower_expression(node.children[0])
+        if len(node.children) > 1:
+            index = self.lower_expression(node.children[1])
+            self.emit('store', identifier, [identifier, index, value])
+        elif identifier in self.arrays:
+            self.emit('fill', identifier, [identifier, value])
+        else:
+            self.emit('copy', identifier, [value])
+
+    def lower_conditional(self, node: ASTNode):
+        condition = self.lower_expression(node.children[0])
+        branch = self.emit('branch', args=[condition])
+
+        then_block = self.new_block()
+        self.current = then_block
+        self.lower_statement(node.children[1])
+        then_end = self.current
+
+        else_end = None
+        if len(node.children) > 2 and node.children[2]:
+            else_block = self.new_block()
+            self.current = else_block
+            self.lower_statement(node.children[2])
+            else_end = self.current
+
+        join = self.new_block()
+        branch.targets = [then_block.label, else_block.label if else_end else join.label]
+        for end in (then_end, else_end):
+            if end is not None and end.terminator is None:
+                end.instructions.append(Instruction('jump', targets=[join.label]))
+        self.current = join
+
+    def lower_for_loop(self, node: ASTNode):
+        initialization = node.children[0]
+        self.lower_assignment(initialization)
+        counter = initialization.value['identifier']
+        # Предел вычисляется один раз, до цикла
+        limit = self.temp()
+        self.emit('copy', limit, [self.lower_expression(node.children[1])])
+
+        preheader = self.new_block()
+        self.start_block(preheader)
+        header = self.new_block()
+        self.start_block(header)
+        condition = self.temp()
+        self.emit('LE', condition, [counter, limit])
+        branch = self.emit('branch', args=[condition])
+
+        body = self.new_block()
+        self.current = body
+        self.lower_statement(node.children[2])
+        self.emit('plus', counter, [counter, self.const(1)])
+        self.emit('jump', targets=[header.label], loc=(node.value.get('line'), node.value.get('column')))
+
+        exit_block = self.new_block()
+        branch.targets = [body.label, exit_block.label]
+        self.loops.append(Loop(preheader.label, header.label, exit_block.label))
+        self.current = exit_block
+
+    def lower_while_loop(self, node: ASTNode):
+        preheader = self.new_block()
+        self.start_block(preheader)
+        header = self.new_block()
+        self.start_block(header)
+        branch = self.emit('branch', args=[self.lower_expression(node.children[0])])
+
+        body = self.new_block()
+        self.current = body
+        self.lower_statement(node.children[1])
+        self.emit('jump', targets=[header.label], loc=(node.value.get('line'), node.value.get('column')))
+
+        exit_block = self.new_block()
+        branch.targets = [body.label, exit_block.label]
+        self.loops.append(Loop(preheader.label, header.label, exit_block.label))
+        self.current = exit_block
+
+    def lower_expression(self, node: ASTNode):
+        if node.type == 'Number':
+            return self.const(float(node.value))
+        if node.type == 'BooleanConstant':
+            return self.const(node.value == 'true')
+        if node.type == 'Identifier':
+            return node.value
+        if node.type == 'Index':
+            index = self.lower_expression(node.children[0])
+            result = self.temp()
+            self.emit('load', result, [node.value, index])
+            return result
+        if node.type in ('Comparison', 'BinaryOperation'):
+            left = self.lower_expression(node.children[0])
+            right = self.lower_expression(node.children[1])
+            result = self.temp()
+            self.emit(node.value['operator'], result, [left, right])
+            return result
+        return self.const(None)
+
+
+def predecessors(blocks: List[BasicBlock]) -> Dict[int, List[int]]:
+    result = {block.label: [] for block in blocks}
+    for block in blocks:
+        for target in block.successors():
+            result[target].append(block.label)
+    return result
+
+def solve_forward(blocks: List[BasicBlock], transfer) -> Dict[int, Optional[frozenset]]:
+    """
+    Прямая задача потока данных со встречей-пересечением.
+    Возвращает множество фактов на входе каждого блока (None - блок недостижим)
+    """
+    preds = predecessors(blocks)
+    inputs = {block.label: None for block in blocks}
+    outputs = {block.label: None for block in blocks}
+    inputs[0] = frozenset()
+    changed = True
+    while changed:
+        changed = False
+        for block in blocks:
+            if block.label != 0:
+                known = [outputs[p] for p in preds[block.label] if outputs[p] is not None]
+                if not known:
+                    continue
+                inputs[block.label] = frozenset.intersection(*known)
+            facts = set(inputs[block.label])
+            for instruction in block.instructions:
+                transfer(instruction, facts)
+            facts = frozenset(facts)
+            if facts != outputs[block.label]:
+                outputs[block.label] = facts
+                changed = True
+    return inputs
+
+def is_pure(instruction: Instruction) -> bool:
+    """
+    Можно ли удалить или вынести команду: деление допускается только на ненулевую константу
+    """
+    if instruction.op == 'copy':
+        return True
+    if instruction.op == 'div':
+        divisor = instruction.args[1]
+        return isinstance(divisor, Const) and divisor.value not in (0, None)
+    return instruction.op in BINARY
+
+def expression_key(instruction: Instruction):
+    left, right = instruction.args
+    if instruction.op in COMMUTATIVE and repr(right) < repr(left):
+        left, right = right, left
+    return instruction.op, left, right
+
+def available_expressions(instruction: Instruction, facts: set):
+    """
+    Факты (операция, операнд, операнд, переменная со значением)
+    """
+    dest = instruction.dest
+    if dest is None:
+        return
+    facts.difference_update([fact for fact in facts if dest in fact[1:]])
+    if instruction.op in BINARY and dest not in instruction.args:
+        facts.add(expression_key(instruction) + (dest,))
+
+def available_copies(instruction: Instruction, facts: set):
+    """
+    Факты (x, y): после x = y ни x, ни y не переприсваивались
+    """
+    dest = instruction.dest
+    if dest is None:
+        return
+    facts.difference_update([fact for fact in facts if dest in fact])
+    if instruction.op == 'copy' and instruction.args[0] != dest and not isinstance(instruction.args[0], Const):
+        facts.add((dest, instruction.args[0]))
+
+def eliminate_common_subexpressions(program: IRProgram) -> int:
+    """
+    Повторное вычисление доступного выражения заменяется копированием
+    """
+    inputs = solve_forward(program.blocks, available_expressions)
+    count = 0
+    for block in program.blocks:
+        if inputs[block.label] is None:
+            continue
+        facts = set(inputs[block.label])
+        kept = []
+        for instruction in block.instructions:
+            if instruction.op in BINARY:
+                key = expression_key(instruction)
+                holder = next((fact[3] for fact in facts if fact[:3] == key), None)
+                if holder == instruction.dest:
+                    count += 1
+                    continue
+                if holder is not None:
+                    instruction.op, instruction.args = 'copy', [holder]
+                    count += 1
+            available_expressions(instruction, facts)
+            kept.append(instruction)
+        block.instructions = kept
+    return count
+
+def propagate_copies(program: IRProgram) -> int:
+    """
+    Использование x после x = y заменяется использованием y
+    """
+    inputs = solve_forward(program.blocks, available_copies)
+    count = 0
+    for block in program.blocks:
+        if inputs[block.label] is None:
+            continue
+        facts = set(inputs[block.label])
+        for instruction in block.instructions:
+            copies = dict(facts)
+            for position, arg in enumerate(instruction.args):
+                if arg in copies:
+                    instruction.args[position] = copies[arg]
+                    count += 1
+            available_copies(instruction, facts)
+    return count
+
+def eliminate_dead_code(program: IRProgram) -> int:
+    """
+    Удаление чистых команд, результат которых не используется.
+    Переменные программы живы в конце (их значения - результат выполнения)
+    """
+    live_in = {block.label: set() for block in program.blocks}
+    changed = True
+    while changed:
+        changed = False
+        for block in reversed(program.blocks):
+            live = set()
+            for target in block.successors():
+                live |= live_in[target]
+            if block.terminator is not None and block.terminator.op == 'halt':
+                live |= set(program.variables)
+            for instruction in reversed(block.instructions):
+                if instruction.dest is not None:
+                    live.discard(instruction.dest)
+                live.update(arg for arg in instruction.args if not isinstance(arg, Const))
+            if live != live_in[block.label]:
+                live_in[block.label] = live
+                changed = True
+
+    count = 0
+    for block in program.blocks:
+        live = set()
+        for target in block.successors():
+            live |= live_in[target]
+        if block.terminator is not None and block.terminator.op == 'halt':
+            live |= set(program.variables)
+        kept = []
+        for instruction in reversed(block.instructions):
+            if instruction.dest is not None and instruction.dest not in live and is_pure(instruction):
+                count += 1
+                continue
+            if instruction.dest is not None:
+                live.discard(instruction.dest)
+            live.update(arg for arg in instruction.args if not isinstance(arg, Const))
+            kept.append(instruction)
+        block.instructions = kept[::-1]
+    return count
+
+def hoist_loop_invariants(program: IRProgram) -> int:
+    """
+    Вынос в предзаголовок цикла вычислений временных переменных,
+    операнды которых в цикле не меняются. Вложенные циклы обрабатываются первыми:
+    цикл попадает в program.loops после своего тела, так что внутренние циклы
+    стоят в списке раньше внешних, и вынесенное из внутреннего цикла за тот же
+    проход может подняться дальше, в предзаголовок внешнего
+    """
+    count = 0
+    for loop in program.loops:
+        blocks = program.blocks[loop.header:loop.end]
+        definitions = {}
+        for block in blocks:
+            for instruction in block.instructions:
+                if instruction.dest is not None:
+                    definitions[instruction.dest] = definitions.get(instruction.dest, 0) + 1
+
+        preheader = program.blocks[loop.preheader]
+        changed = True
+        while changed:
+            changed = False
+            for block in blocks:
+                for instruction in list(block.instructions):
+                    if not (isinstance(instruction.dest, Temp) and is_pure(instruction)
+                            and definitions.get(instruction.dest) == 1
+                            and all(definitions.get(arg, 0) == 0 for arg in instruction.args
+                                    if not isinstance(arg, Const))):
+                        continue
+                    block.instructions.remove(instruction)
+                    preheader.instructions.insert(len(preheader.instructions) - 1, instruction)
+                    definitions[instruction.dest] = 0
+                    count += 1
+                    changed = True
+    return count
+
+def optimize(program: IRProgram, max_rounds: int = 10) -> IRProgram:
+    """
+    Применение оптимизаций до неподвижной точки; число изменений - в program.stats
+    """
+    passes = (('cse', eliminate_common_subexpressions), ('copies', propagate_copies),
+              ('dead', eliminate_dead_code), ('hoisted', hoist_loop_invariants))
+    for _ in range(max_rounds):
+        changed = 0
+        for name, optimization in passes:
+            done = optimization(program)
+            program.stats[name] += done
+            changed += done
+        if not changed:
+            break
+    return program
+
+def compile_ir(ast: ASTNode, symbols: SymbolTable, optimized: bool = True) -> IRProgram:
+    """
+    Перевод AST в трёхадресный код (с оптимизацией)
+    """
+    program = IRBuilder(symbols).build(ast)
+    return optimize(program) if optimized else program
+
+
+# Коды команд исполнителя
+(_BINARY, _COPY, _BRANCH, _JUMP, _BACK_EDGE, _WRITE, _LOAD, _STORE, _FILL, _ALLOC,
+ _READ, _READ_ARRAY, _WRITELN, _HALT) = range(14)
+
+class IRExecutor:
+    """
+    Выполнение трёхадресного кода: операнды размещаются в массиве регистров,
+    блоки - в одном списке команд с вычисленными адресами переходов
+    """
+    def __init__(self, program: IRProgram, output: OutputSink = None,
+                 max_steps: Optional[int] = None, time_limit: Optional[float] = None,
+                 reader: InputReader = None):
+        self.program = program
+        self.output = output if output is not None else StreamSink()
+        self.reader = reader
+        self.max_steps = max_steps
+        self.time_limit = time_limit
+        self.variable_values: Dict[int, Any] = {}
+        self.slots: Dict[Any, int] = {}
+        self.registers: List[Any] = []
+        self.code = self.assemble()
+
+    def slot(self, operand) -> int:
+        if operand not in self.slots:
+            self.slots[operand] = len(self.registers)
+            self.registers.append(operand.value if isinstance(operand, Const) else None)
+        return self.slots[operand]
+
+    def assemble(self) -> list:
+        addresses = {}
+        position = 0
+        for block in self.program.blocks:
+            addresses[block.label] = position
+            position += len(block.instructions)
+
+        code = []
+        slot = self.slot
+        for block in self.program.blocks:
+            for instruction in block.instructions:
+                op, args = instruction.op, instruction.args
+                if op in BINARY:
+                    code.append((_BINARY, BINARY[op], slot(instruction.dest), slot(args[0]), slot(args[1])))
+                elif op == 'copy':
+                    code.append((_COPY, None, slot(instruction.dest), slot(args[0]), None))
+                elif op == 'write':
+                    code.append((_WRITE, None, None, slot(args[0]), None))
+                elif op == 'load':
+                    code.append((_LOAD, None, slot(instruction.dest), slot(args[0]), slot(args[1])))
+                elif op == 'store':
+                    # Записываемое значение - во втором поле
+                    code.append((_STORE, slot(args[2]), None, slot(args[0]), slot(args[1])))
+                elif op == 'fill':
+                    code.append((_FILL, None, None, slot(args[0]), slot(args[1])))
+                elif op == 'alloc':
+                    code.append((_ALLOC, (args[0].value, args[1].value), slot(instruction.dest), None, None))
+                elif op == 'read':
+                    code.append((_READ, args[0].value, slot(instruction.dest), None, None))
+                elif op == 'read_array':
+                    code.append((_READ_ARRAY, args[1].value, None, slot(args[0]), None))
+                elif op == 'writeln':
+                    code.append((_WRITELN, tuple(slot(arg) for arg in args), None, None, None))
+                elif op == 'branch':
+                    code.append((_BRANCH, None, addresses[instruction.targets[0]], slot(args[0]),
+                                 addresses[instruction.targets[1]]))
+                elif op == 'jump':
+                    kind = _BACK_EDGE if instruction.loc else _JUMP
+                    code.append((kind, instruction.loc, addresses[instruction.targets[0]], None, None))
+                else:
+                    code.append((_HALT, None, None, None, None))
+        for variable in self.program.variables:
+            slot(variable)
+        return code
+
+    def run(self) -> Dict[int, Any]:
+        """
+        Выполнение программы; возвращает значения переменных по номерам имён
+        """
+        code = self.code
+        registers = self.registers
+        write = self.output.write
+        steps = 0
+        max_steps = self.max_steps if self.max_steps is not None else float('inf')
+        deadline = time.monotonic() + self.time_limit if self.time_limit is not None else None
+        pc = 0
+        try:
+            while True:
+                kind, function, dest, a, b = code[pc]
+                if kind == _BINARY:
+                    registers[dest] = function(registers[a], registers[b])
+                    pc += 1
+                elif kind == _COPY:
+                    registers[dest] = registers[a]
+                    pc += 1
+                elif kind == _BRANCH:
+                    pc = dest if registers[a] else b
+                elif kind == _BACK_EDGE:
+                    steps += 1
+                    if steps > max_steps or (deadline is not None and steps % DEADLINE_CHECK_INTERVAL == 0
+                                             and time.monotonic() > deadline):
+                        self.collect()
+                        line, column = function
+                        name = self.program.symbols.name
+                        raise BudgetExceeded('steps' if steps > max_steps else 'time', steps, line, column,
+                                             {name(v): value for v, value in self.variable_values.items()})
+                    pc = dest
+                elif kind == _JUMP:
+                    pc = dest
+                elif kind == _WRITE:
+                    write(registers[a])
+                    pc += 1
+                elif kind == _LOAD:
+                    array = registers[a]
+                    registers[dest] = array.item(array_index(array, registers[b]))
+                    pc += 1
+                elif kind == _STORE:
+                    array = registers[a]
+                    array[array_index(array, registers[b])] = registers[function]
+                    pc += 1
+                elif kind == _FILL:
+                    registers[a][...] = registers[b]
+                    pc += 1
+                elif kind == _ALLOC:
+                    registers[dest] = new_array(*function)
+                    pc += 1
+                elif kind == _READ:
+                    registers[dest] = self.input().read_value(function)
+                    pc += 1
+                elif kind == _READ_ARRAY:
+                    self.input().read_array(registers[a], function)
+                    pc += 1
+                elif kind == _WRITELN:
+                    self.output.write_line([registers[slot] for slot in function])
+                    pc += 1
+                else:
+                    break
+        finally:
+            self.output.flush()
+        self.collect()
+        return self.variable_values
+
+    def input(self) -> InputReader:
+        """
+        Ввод readln; по умолчанию стандартный ввод открывается при первом обращении
+        """
+        if self.reader is None:
+            self.reader = InputReader()
+        return self.reader
+
+    def collect(self):
+        for variable in self.program.variables:
+            self.variable_values[variable] = self.registers[self.slots[variable]]
+
+
+def main():
+    from src.lexer import LexicalAnalyzer
+    from src.parser import SyntaxAnalyzer
+    from src.interpreter import Interpreter
+    from src.sinks import MemorySink
+
+    sample_code = '''
+    program var
+        A int;
+        B int;
+        X int;
+        Y int;
+        S int;
+    begin
+        A as 3;
+        B as 4;
+        for X as 1 to 100000 do
+            [Y as A mult B;
+            S as S plus A mult B;
+            if A mult B GT 10 then
+                S as S plus Y];
+        write(S)
+    end.
+    '''
+
+    lexer = LexicalAnalyzer()
+    parser = SyntaxAnalyzer(lexer.tokenize(sample_code), debug=False)
+    ast = parser.parse()
+
+    program = compile_ir(ast, lexer.symbols, optimized=False)
+    print("Трёхадресный код:")
+    print(program.dump())
+    optimize(program)
+    print("\nПосле оптимизации:")
+    print(program.dump())
+    print(f"\nИзменения: {program.stats}")
+
+    start = time.perf_counter()
+    interpreter = Interpreter(parser.symbol_table, lexer.symbols, output=MemorySink())
+    interpreter.execute_node(ast)
+    print(f"\nAST: {time.perf_counter() - start:.3f} с, {interpreter.named_values()}")
+
+    start = time.perf_counter()
+    executor = IRExecutor(program, output=MemorySink())
+    values = executor.run()
+    print(f"IR: {time.perf_counter() - start:.3f} с, "
+          f"{ {lexer.symbols.name(v): value for v, value in values.items()} }")
+
+if __name__ == "__main__":
+    main()
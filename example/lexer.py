@@ -1,5 +1,6 @@
 import enum
 from typing import List, NamedTuple
+from src.symbols import SymbolTable
 
 class TokenType(enum.Enum):
     KEYWORD = 1
@@ -15,26 +16,30 @@ class Token(NamedTuple):
     value: str
     line: int
     column: int
+    symbol: int = -1  # номер имени в SymbolTable для ключевых слов и идентификаторов
 
 class LexicalAnalyzer:
-    def __init__(self):
-        self.keywords = {
-            'program', 'var', 'begin', 'end', 'int', 'float', 'bool',
-            'if', 'then', 'else', 'for', 'to', 'do', 'while', 
-            'true', 'false', 'write'  # Добавлен 'write'
-        }
+    def __init__(self, symbols: SymbolTable = None):
+        # Ключевые слова заранее внесены в таблицу имён
+        self.symbols = symbols or SymbolTable()
         self.relation_ops = {'NE', 'EQ', 'LT', 'LE', 'GT', 'GE'}
         self.addition_ops = {'plus', 'min', 'or'}
         self.multiplication_ops = {'mult', 'div', 'and'}
 
-    def tokenize(self, code: str) -> List[Token]:
+    def tokenize(self, code: str, first_line: int = 1) -> List[Token]:
+        """
+        Разбиение текста на токены; first_line - номер первой строки текста
+        (нужен, когда лексируется фрагмент большого файла)
+        """
         tokens = []
         lines = code.split('\n')
 
         multi_char_ops = self.relation_ops.union(
             self.addition_ops).union(self.multiplication_ops).union({'as'})
+        symbols = self.symbols
+        end_symbol = symbols.intern('end.')
 
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(lines, first_line):
             column = 0
             while column < len(line):
                 if line[column].isspace():
@@ -52,7 +57,7 @@ class LexicalAnalyzer:
 
                 # Специальный случай: end.
                 if line[column:].startswith('end.'):
-                    tokens.append(Token(TokenType.KEYWORD, 'end.', line_num, column))
+                    tokens.append(Token(TokenType.KEYWORD, 'end.', line_num, column, end_symbol))
                     column += len('end.')
                     continue
 
@@ -69,9 +74,10 @@ class LexicalAnalyzer:
                         while column < len(line) and (line[column].isalnum()):
                             column += 1
                         value = line[start:column]
-                        token_type = (TokenType.KEYWORD if value in self.keywords 
+                        symbol = symbols.intern(value)
+                        token_type = (TokenType.KEYWORD if symbols.is_keyword(symbol)
                                       else TokenType.IDENTIFIER)
-                        tokens.append(Token(token_type, value, line_num, start))
+                        tokens.append(Token(token_type, value, line_num, start, symbol))
                         continue
 
                     # Числа
@@ -88,10 +94,10 @@ class LexicalAnalyzer:
                         continue
 
                     # Простые операторы и разделители
-                    simple_ops = {'+', '-', '*', '/', '(', ')', ':', ';', '[', ']'}
+                    simple_ops = {'+', '-', '*', '/', '(', ')', ':', ';', '[', ']', ','}
                     if line[column] in simple_ops:
                         tokens.append(Token(
-                            TokenType.DELIMITER if line[column] in '();:[]' else TokenType.OPERATOR,
+                            TokenType.DELIMITER if line[column] in '();:[],' else TokenType.OPERATOR,
                             line[column], line_num, column))
                         column += 1
                         continue
@@ -0,0 +1,623 @@
+import argparse
+import os
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from src.lexer import LexicalAnalyzer, Token, TokenType
+from src.parser import ASTNode, SyntaxAnalyzer
+#Генератор LL(1)-разборщиков: по грамматике из файла (см. grammar.txt) строятся множества
+#FIRST и FOLLOW и управляющая таблица, по которой TableParser строит то же AST, что SyntaxAnalyzer
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grammar.txt')
+
+EPSILON = 'ε'  # пустая цепочка во множествах FIRST
+END = '$'  # конец входа во множествах FOLLOW
+
+# Терминалы, которые сопоставляются с типом токена, а не с его текстом
+TOKEN_CLASSES = {'IDENTIFIER': TokenType.IDENTIFIER, 'NUMBER': TokenType.NUMBER}
+
+GRAMMAR_TOKEN = re.compile(r"\s+|#.*|'[^']+'|[@?]?\w+|[:|;]")
+
+def is_terminal(symbol: str) -> bool:
+    return symbol.startswith("'") or symbol in TOKEN_CLASSES or symbol == END
+
+def is_action(symbol: str) -> bool:
+    return symbol.startswith('@')
+
+class Production(NamedTuple):
+    """
+    Альтернатива правила: символы правой части (терминалы в кавычках,
+    IDENTIFIER, NUMBER, нетерминалы и действия @имя) и необязательный предикат
+    """
+    head: str
+    symbols: Tuple[str, ...]
+    predicate: Optional[str]
+    line: int
+
+    def grammar_symbols(self) -> Tuple[str, ...]:
+        """
+        Правая часть без действий
+        """
+        return tuple(symbol for symbol in self.symbols if not is_action(symbol))
+
+    def describe(self) -> str:
+        body = ' '.join(self.symbols) or EPSILON
+        guard = f"?{self.predicate} " if self.predicate else ''
+        return f"{self.head} : {guard}{body}"
+
+class Grammar:
+    """
+    Грамматика: правила в порядке записи в файле; стартовый символ - голова первого правила
+    """
+    def __init__(self, productions: List[Production]):
+        self.productions = productions
+        self.nonterminals: List[str] = []
+        self.alternatives: Dict[str, List[int]] = {}
+        for number, production in enumerate(productions):
+            if production.head not in self.alternatives:
+                self.nonterminals.append(production.head)
+                self.alternatives[production.head] = []
+            self.alternatives[production.head].append(number)
+        self.start = self.nonterminals[0]
+
+        self.terminals: List[str] = []
+        self.actions: List[str] = []
+        self.predicates: List[str] = []
+        for production in productions:
+            if production.predicate and production.predicate not in self.predicates:
+                self.predicates.append(production.predicate)
+            for symbol in production.symbols:
+                if is_action(symbol):
+                    if symbol[1:] not in self.actions:
+                        self.actions.append(symbol[1:])
+                elif is_terminal(symbol):
+                    if symbol not in self.terminals:
+                        self.terminals.append(symbol)
+                elif symbol not in self.alternatives:
+                    raise ValueError(f"Грамматика, строка {production.line}: "
+                                     f"нетерминал {symbol} не определён")
+
+def read_grammar(text: str) -> Grammar:
+    """
+    Разбор текста грамматики: правила вида
+    имя : альтернатива | альтернатива ;
+    """
+    productions = []
+    head = None
+    body: List[str] = []
+    predicate = None
+    for line_number, line in enumerate(text.split('\n'), 1):
+        position = 0
+        while position < len(line):
+            match = GRAMMAR_TOKEN.match(line, position)
+            if match is None:
+                raise ValueError(f"Грамматика, строка {line_number}: неожиданный символ {line[position]!r}")
+            position = match.end()
+            word = match.group()
+            if word.isspace() or word.startswith('#'):
+                continue
+
+            if head is None:
+                if not word.isidentifier() or not word.islower():
+                    raise ValueError(f"Грамматика, строка {line_number}: ожидалось имя правила, получено {word}")
+                head, rule_line = word, line_number
+                colon = GRAMMAR_TOKEN.match(line, position)
+                while colon and colon.group().isspace():
+                    colon = GRAMMAR_TOKEN.match(line, colon.end())
+                if colon is None or colon.group() != ':':
+                    raise ValueError(f"Грамматика, строка {line_number}: после {word} ожидалось ':'")
+                position = colon.end()
+            elif word in ('|', ';'):
+                productions.append(Production(head, tuple(body), predicate, rule_line))
+                body, predicate = [], None
+                if word == ';':
+                    head = None
+            elif word.startswith('?'):
+                if body or predicate:
+                    raise ValueError(f"Грамматика, строка {line_number}: "
+                                     f"предикат {word} должен открывать альтернативу")
+                predicate = word[1:]
+            elif word == ':':
+                raise ValueError(f"Грамматика, строка {line_number}: пропущена ';' перед этим правилом")
+            else:
+                body.append(word)
+    if head is not None:
+        raise ValueError(f"Грамматика: правило {head} не завершено ';'")
+    if not productions:
+        raise ValueError("Грамматика пуста")
+    return Grammar(productions)
+
+def compute_first(grammar: Grammar) -> Dict[str, Set[str]]:
+    """
+    Множества FIRST нетерминалов (EPSILON - нетерминал порождает пустую цепочку)
+    """
+    first: Dict[str, Set[str]] = {nonterminal: set() for nonterminal in grammar.nonterminals}
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            result = first_of_sequence(production.grammar_symbols(), first)
+            if not result <= first[production.head]:
+                first[production.head] |= result
+                changed = True
+    return first
+
+def first_of_sequence(symbols: Tuple[str, ...], first: Dict[str, Set[str]]) -> Set[str]:
+    """
+    FIRST цепочки символов
+    """
+    result = set()
+    for symbol in symbols:
+        if is_terminal(symbol):
+            result.add(symbol)
+            return result
+        result |= first[symbol] - {EPSILON}
+        if EPSILON not in first[symbol]:
+            return result
+    result.add(EPSILON)
+    return result
+
+def compute_follow(grammar: Grammar, first: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """
+    Множества FOLLOW нетерминалов (END - конец входа)
+    """
+    follow: Dict[str, Set[str]] = {nonterminal: set() for nonterminal in grammar.nonterminals}
+    follow[grammar.start].add(END)
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            symbols = production.grammar_symbols()
+            for position, symbol in enumerate(symbols):
+                if is_terminal(symbol):
+                    continue
+                rest = first_of_sequence(symbols[position + 1:], first)
+                result = rest - {EPSILON}
+                if EPSILON in rest:
+                    result |= follow[production.head]
+                if not result <= follow[symbol]:
+                    follow[symbol] |= result
+                    changed = True
+    return follow
+
+class Conflict(NamedTuple):
+    """
+    Несколько альтернатив нетерминала для одного входного терминала
+    """
+    nonterminal: str
+    terminal: str
+    productions: Tuple[int, ...]
+    resolution: str
+
+    def describe(self, grammar: Grammar) -> str:
+        alternatives = '; '.join(grammar.productions[number].describe() for number in self.productions)
+        return f"{self.nonterminal} при {self.terminal}: {alternatives} -> {self.resolution}"
+
+class ParseTable:
+    """
+    Управляющая таблица, в которой символы грамматики заменены целыми числами:
+    виды токенов 0..kind_count-1, за ними нетерминалы, за ними действия.
+    cells[нетерминал * kind_count + вид токена] - номер альтернативы,
+    -1 (ошибка) или -2-i для выбора по предикатам choices[i].
+    bodies[альтернатива] - её символы в обратном порядке для стека разбора
+    """
+    def __init__(self, grammar: Grammar):
+        self.grammar = grammar
+        self.first = compute_first(grammar)
+        self.follow = compute_follow(grammar, self.first)
+
+        # Виды токенов: терминалы грамматики, конец входа и "неизвестный" (не встречается в грамматике)
+        self.terminal_names = grammar.terminals + [END, '?']
+        self.kind_count = len(self.terminal_names)
+        self.end_kind = self.kind_count - 2
+        self.unknown_kind = self.kind_count - 1
+        kind = {name: number for number, name in enumerate(self.terminal_names)}
+        self.literal_kinds = {name[1:-1]: number for name, number in kind.items() if name.startswith("'")}
+        self.identifier_kind = kind.get('IDENTIFIER', self.unknown_kind)
+        self.number_kind = kind.get('NUMBER', self.unknown_kind)
+
+        nonterminal_base = self.kind_count
+        self.action_base = nonterminal_base + len(grammar.nonterminals)
+        code = dict(kind)
+        code.update((name, nonterminal_base + number) for number, name in enumerate(grammar.nonterminals))
+        code.update(('@' + name, self.action_base + number) for number, name in enumerate(grammar.actions))
+        self.start = code[grammar.start]
+        self.bodies = [tuple(code[symbol] for symbol in reversed(self.inline(production.symbols)))
+                       for production in grammar.productions]
+
+        self.cells = [-1] * (self.action_base * self.kind_count)
+        self.choices: List[Tuple[Tuple[int, int], ...]] = []
+        self.conflicts: List[Conflict] = []
+        for nonterminal in grammar.nonterminals:
+            candidates: Dict[str, List[int]] = {}
+            for number in grammar.alternatives[nonterminal]:
+                production = grammar.productions[number]
+                lookahead = first_of_sequence(production.grammar_symbols(), self.first)
+                if EPSILON in lookahead:
+                    lookahead = (lookahead - {EPSILON}) | self.follow[nonterminal]
+                for terminal in lookahead:
+                    candidates.setdefault(terminal, []).append(number)
+            row = code[nonterminal] * self.kind_count
+            for terminal, numbers in candidates.items():
+                self.cells[row + kind[terminal]] = self.resolve(nonterminal, terminal, numbers)
+
+    def inline(self, symbols: Tuple[str, ...], expanding: Tuple[str, ...] = ()) -> List[str]:
+        """
+        Подстановка нетерминалов с единственной альтернативой без предиката:
+        на их месте в стек сразу кладётся правая часть, без обращения к таблице
+        """
+        result = []
+        for symbol in symbols:
+            alternatives = self.grammar.alternatives.get(symbol, ())
+            production = self.grammar.productions[alternatives[0]] if len(alternatives) == 1 else None
+            if production is None or production.predicate or symbol in expanding:
+                result.append(symbol)
+            else:
+                result.extend(self.inline(production.symbols, expanding + (symbol,)))
+        return result
+
+    def resolve(self, nonterminal: str, terminal: str, numbers: List[int]) -> int:
+        """
+        Содержимое клетки таблицы. Альтернативы с предикатами проверяются по порядку
+        при разборе, затем берётся первая альтернатива без предиката.
+        Прочие конфликты разрешаются в пользу альтернативы, записанной первой
+        """
+        productions = self.grammar.productions
+        guarded = [number for number in numbers if productions[number].predicate]
+        plain = [number for number in numbers if not productions[number].predicate]
+        if len(plain) > 1:
+            self.conflicts.append(Conflict(nonterminal, terminal, tuple(numbers),
+                                           f"выбрана первая альтернатива: {productions[plain[0]].describe()}"))
+        if not guarded:
+            return plain[0]
+
+        if len(numbers) > 1:
+            predicates = ', '.join(f"?{productions[number].predicate}" for number in guarded)
+            self.conflicts.append(Conflict(nonterminal, terminal, tuple(numbers),
+                                           f"выбор по предикату {predicates}"))
+        predicates = self.grammar.predicates
+        choice = tuple((predicates.index(productions[number].predicate), number) for number in guarded)
+        choice += ((-1, plain[0] if plain else -1),)
+        self.choices.append(choice)
+        return -1 - len(self.choices)
+
+    def token_kinds(self, tokens: List[Token]) -> List[int]:
+        """
+        Виды токенов программы; в конце - вид конца входа
+        """
+        literal, unknown = self.literal_kinds, self.unknown_kind
+        identifier_kind, number_kind = self.identifier_kind, self.number_kind
+        identifier, number = TokenType.IDENTIFIER, TokenType.NUMBER
+        kinds = [identifier_kind if token.type is identifier
+                 else number_kind if token.type is number
+                 else literal.get(token.value, unknown)
+                 for token in tokens]
+        kinds.append(self.end_kind)
+        return kinds
+
+    def expected(self, nonterminal: int) -> List[str]:
+        """
+        Терминалы, с которых может начинаться нетерминал в текущем месте
+        """
+        row = nonterminal * self.kind_count
+        return [self.terminal_names[kind] for kind in range(self.kind_count)
+                if self.cells[row + kind] != -1]
+
+    def report(self, sets: bool = False) -> List[str]:
+        """
+        Описание грамматики: размеры, конфликты и (sets=True) множества FIRST и FOLLOW
+        """
+        grammar = self.grammar
+        lines = [f"Нетерминалов: {len(grammar.nonterminals)}, терминалов: {len(grammar.terminals)}, "
+                 f"альтернатив: {len(grammar.productions)}, действий: {len(grammar.actions)}"]
+        for nonterminal in grammar.nonterminals if sets else ():
+            lines.append(f"{nonterminal}: FIRST = {{{', '.join(sorted(self.first[nonterminal]))}}}, "
+                         f"FOLLOW = {{{', '.join(sorted(self.follow[nonterminal]))}}}")
+        for conflict in self.conflicts:
+            lines.append(f"Конфликт: {conflict.describe(grammar)}")
+        return lines
+
+@lru_cache(maxsize=8)
+def load_table(path: str = GRAMMAR_PATH) -> ParseTable:
+    """
+    Таблица для грамматики из файла (строится один раз на процесс)
+    """
+    with open(path, encoding='utf-8') as file:
+        return ParseTable(read_grammar(file.read()))
+
+class ParseError(SyntaxError):
+    """
+    Синтаксическая ошибка с местом токена (line и column; None - конец текста)
+    """
+    def __init__(self, message: str, token: Optional[Token]):
+        if token is None:
+            super().__init__("Неожиданный конец токенов")
+            self.line = self.column = None
+        else:
+            super().__init__(f"{message} (строка {token.line}, позиция {token.column})")
+            self.line, self.column = token.line, token.column
+
+class TableParser:
+    """
+    Нерекурсивный разбор по LL(1)-таблице: альтернатива выбирается одним обращением
+    к таблице по виду текущего токена. Действия грамматики строят AST на стеке значений;
+    результат и таблица символов те же, что у SyntaxAnalyzer
+    """
+    def __init__(self, tokens: List[Token], table: ParseTable = None):
+        self.tokens = tokens
+        self.table = table or load_table()
+        self.symbol_table: Dict[int, Dict] = {}
+        self.values: List = []
+        self.actions = [getattr(self, 'action_' + name) for name in self.table.grammar.actions]
+        self.predicates = [getattr(self, 'predicate_' + name) for name in self.table.grammar.predicates]
+
+    def parse(self) -> ASTNode:
+        table = self.table
+        kinds = table.token_kinds(self.tokens)
+        cells, bodies, kind_count, action_base = table.cells, table.bodies, table.kind_count, table.action_base
+        actions = self.actions
+
+        stack = [table.start]
+        position = 0
+        kind = kinds[0]
+        while stack:
+            symbol = stack.pop()
+            if symbol < kind_count:
+                if symbol != kind:
+                    raise self.mismatch(symbol, position)
+                position += 1
+                kind = kinds[position]
+            elif symbol < action_base:
+                production = cells[symbol * kind_count + kind]
+                if production < 0:
+                    production = self.choose(symbol, production, position)
+                stack.extend(bodies[production])
+            else:
+                actions[symbol - action_base](position)
+        return self.values.pop()
+
+    def choose(self, nonterminal: int, cell: int, position: int) -> int:
+        """
+        Выбор альтернативы в клетке с предикатами
+        """
+        if cell != -1:
+            for predicate, production in self.table.choices[-2 - cell]:
+                if predicate < 0 or self.predicates[predicate](position):
+                    if production >= 0:
+                        return production
+                    break
+        token = self.tokens[position] if position < len(self.tokens) else None
+        # Терминал, отвергнутый предикатом, в ожидаемые не входит
+        expected = ', '.join(name for name in self.table.expected(nonterminal)
+                             if token is None or name != self.table.terminal_names[self.kind_of(position)])
+        raise ParseError(f"Неожиданный токен: {token.value if token else ''}; ожидалось: {expected}", token)
+
+    def kind_of(self, position: int) -> int:
+        return self.table.token_kinds(self.tokens[position:position + 1])[0]
+
+    def mismatch(self, kind: int, position: int) -> ParseError:
+        token = self.tokens[position] if position < len(self.tokens) else None
+        return ParseError(f"Ожидалось значение {self.table.terminal_names[kind]}, "
+                            f"получено '{token.value if token else ''}'", token)
+
+    # Предикаты: position - номер текущего токена
+
+    def predicate_array(self, position: int) -> bool:
+        """
+        Последний разобранный идентификатор - имя массива
+        """
+        return 'size' in self.symbol_table.get(self.tokens[position - 1].symbol, {})
+
+    # Действия: position - номер текущего токена, разобранный последним - position - 1
+
+    def action_push(self, position: int):
+        self.values.append(self.tokens[position - 1])
+
+    def action_mark(self, position: int):
+        token = self.tokens[position]
+        self.values.append((token.line, token.column))
+
+    def action_none(self, position: int):
+        self.values.append(None)
+
+    def action_list(self, position: int):
+        self.values.append([])
+
+    def action_append(self, position: int):
+        item = self.values.pop()
+        self.values[-1].append(item)
+
+    def action_size(self, position: int):
+        token = self.tokens[position - 1]
+        size = token.value
+        if not size.isdigit() or int(size) == 0:
+            raise ParseError(f"Размер массива должен быть положительным целым числом, получено {size}", token)
+        self.values.append(int(size))
+
+    def action_declaration(self, position: int):
+        values = self.values
+        size = values.pop()
+        var_type = values.pop().value
+        identifier = values.pop().symbol
+        entry = {'type': var_type}
+        if size is not None:
+            entry['size'] = size
+        self.symbol_table[identifier] = entry
+        values.append(ASTNode('VariableDeclaration', value={'identifier': identifier, **entry}))
+
+    def action_declarations(self, position: int):
+        self.values.append(ASTNode('VariableDeclarations', children=self.values.pop()))
+
+    def action_statements(self, position: int):
+        self.values.append(ASTNode('StatementBlock', children=self.values.pop()))
+
+    def action_block(self, position: int):
+        self.values.append(ASTNode('Block', children=self.values.pop()))
+
+    def action_program(self, position: int):
+        statements = self.values.pop()
+        declarations = self.values.pop()
+        self.values.append(ASTNode('Program', children=[declarations, statements]))
+
+    def action_assignment(self, position: int):
+        values = self.values
+        expression = values.pop()
+        index = values.pop()
+        start = values.pop()
+        values.append(ASTNode('Assignment',
+                              value={'identifier': start.symbol, 'line': start.line, 'column': start.column},
+                              children=[expression, index] if index else [expression]))
+
+    def action_write(self, position: int):
+        expression = self.values.pop()
+        line, column = self.values.pop()
+        self.values.append(ASTNode('WriteStatement', value={'line': line, 'column': column},
+                                   children=[expression]))
+
+    def action_read(self, position: int):
+        targets = self.values.pop()
+        line, column = self.values.pop()
+        self.values.append(ASTNode('ReadStatement', value={'line': line, 'column': column},
+                                   children=targets))
+
+    def action_writeln(self, position: int):
+        arguments = self.values.pop()
+        line, column = self.values.pop()
+        self.values.append(ASTNode('WriteLineStatement', value={'line': line, 'column': column},
+                                   children=arguments))
+
+    def action_conditional(self, position: int):
+        values = self.values
+        false_branch = values.pop()
+        true_branch = values.pop()
+        condition = values.pop()
+        line, column = values.pop()
+        values.append(ASTNode('ConditionalStatement', value={'line': line, 'column': column},
+                              children=[condition, true_branch, false_branch] if false_branch
+                              else [condition, true_branch]))
+
+    def action_for(self, position: int):
+        values = self.values
+        body = values.pop()
+        limit = values.pop()
+        initialization = values.pop()
+        line, column = values.pop()
+        values.append(ASTNode('ForLoop', value={'line': line, 'column': column},
+                              children=[initialization, limit, body]))
+
+    def action_while(self, position: int):
+        values = self.values
+        body = values.pop()
+        condition = values.pop()
+        line, column = values.pop()
+        values.append(ASTNode('WhileLoop', value={'line': line, 'column': column},
+                              children=[condition, body]))
+
+    def action_comparison(self, position: int):
+        values = self.values
+        right = values.pop()
+        operator = values.pop().value
+        left = values.pop()
+        values.append(ASTNode('Comparison', value={'operator': operator}, children=[left, right]))
+
+    def action_binary(self, position: int):
+        values = self.values
+        right = values.pop()
+        operator = values.pop().value
+        left = values.pop()
+        values.append(ASTNode('BinaryOperation', value={'operator': operator}, children=[left, right]))
+
+    def action_boolean(self, position: int):
+        self.values.append(ASTNode('BooleanConstant', value=self.tokens[position - 1].value))
+
+    def action_number(self, position: int):
+        self.values.append(ASTNode('Number', value=self.tokens[position - 1].value))
+
+    def action_identifier(self, position: int):
+        self.values.append(ASTNode('Identifier', value=self.tokens[position - 1].symbol))
+
+    def action_index(self, position: int):
+        index = self.values.pop()
+        array = self.values.pop()
+        self.values.append(ASTNode('Index', value=array.value, children=[index]))
+
+def same_tree(left: ASTNode, right: ASTNode) -> bool:
+    """
+    Совпадение двух деревьев по типам, значениям и потомкам
+    """
+    stack = [(left, right)]
+    while stack:
+        left, right = stack.pop()
+        if left is None or right is None:
+            if left is not right:
+                return False
+            continue
+        if (left.type != right.type or left.value != right.value
+                or len(left.children) != len(right.children)):
+            return False
+        stack.extend(zip(left.children, right.children))
+    return True
+
+def compare_parsers(code: str, repeat: int = 5) -> Tuple[bool, float, float]:
+    """
+    Сравнение TableParser с SyntaxAnalyzer на тексте программы:
+    совпадают ли деревья и лучшее время разбора каждым
+    """
+    tokens = LexicalAnalyzer().tokenize(code)
+    table = load_table()
+    expected = SyntaxAnalyzer(tokens, debug=False).parse()
+    same = same_tree(expected, TableParser(tokens, table).parse())
+
+    timings = []
+    for make_parser in (lambda: SyntaxAnalyzer(tokens, debug=False), lambda: TableParser(tokens, table)):
+        best = None
+        for _ in range(repeat):
+            parser = make_parser()
+            start = time.perf_counter()
+            parser.parse()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best)
+    return same, timings[0], timings[1]
+
+def main():
+    arguments = argparse.ArgumentParser(description='Генератор LL(1)-таблицы по грамматике модельного языка')
+    arguments.add_argument('files', nargs='*', help='программы для сравнения с SyntaxAnalyzer')
+    arguments.add_argument('--grammar', default=GRAMMAR_PATH, help='файл грамматики')
+    arguments.add_argument('--sets', action='store_true', help='напечатать множества FIRST и FOLLOW')
+    options = arguments.parse_args()
+
+    table = load_table(options.grammar)
+    for line in table.report(options.sets):
+        print(line)
+
+    sample_code = '''
+    program var
+        A int;
+        B float;
+        V float[100];
+    begin
+        A as 10;
+        for A as 1 to 100 do
+            [V[A] as A mult 2; if V[A] GT 50 then B as B plus V[A] else B as B min 1]
+        ;
+        if A GT 0 then A as A min 1 else [A as 0; B as 1];
+        write(B)
+    end.
+    '''
+    sources = []
+    for path in options.files:
+        with open(path, encoding='utf-8') as file:
+            sources.append((path, file.read()))
+    if not sources:
+        sources.append(('пример ×500', sample_code.replace(
+            'write(B)', ';\n'.join(['B as B plus A'] * 500) + ';\nwrite(B)')))
+
+    for name, code in sources:
+        same, recursive, table_driven = compare_parsers(code)
+        print(f"{name}: деревья {'совпадают' if same else 'РАЗЛИЧАЮТСЯ'}, "
+              f"SyntaxAnalyzer {recursive * 1000:.2f} мс, TableParser {table_driven * 1000:.2f} мс")
+
+if __name__ == "__main__":
+    main()
@@ -2,30 +2,42 @@ from src.lexer import LexicalAnalyzer
 from src.parser import SyntaxAnalyzer
 from src.semantic_analyzer import SemanticAnalyzer
 from src.interpreter import Interpreter
+from src.memory import MemoryTracker, tracked_phase
+from src.trace import TraceBuffer, TracingInterpreter
+from src.runtime_io import InputReader
 
-def process_file(file_path):
+def process_file(file_path, track_memory=False, memory_limits=None, trace_path=None, input_path=None):
     """
-    Обработка файла с программой на модельном языке
+    Обработка файла с программой на модельном языке.
+    track_memory - вывести память по этапам, memory_limits - лимиты этапов в байтах,
+    trace_path - файл для трассы выполнения (просмотр: python -m src.trace файл),
+    input_path - файл с вводом для readln (по умолчанию - стандартный ввод)
     """
+    tracker = MemoryTracker(memory_limits) if track_memory or memory_limits else None
+    if tracker is not None:
+        tracker.start()
     try:
         with open(file_path, 'r') as file:
             code = file.read()
         
         # Лексический анализ
         lexer = LexicalAnalyzer()
-        tokens = lexer.tokenize(code)
+        with tracked_phase(tracker, 'lexing'):
+            tokens = lexer.tokenize(code)
         print("Лексический анализ завершен. Токены:")
         for token in tokens:
             print(f"{token.type}: {token.value}")
 
         # Синтаксический анализ
-        parser = SyntaxAnalyzer(tokens)
-        ast = parser.parse()
+        with tracked_phase(tracker, 'parsing'):
+            parser = SyntaxAnalyzer(tokens)
+            ast = parser.parse()
         print("\nАбстрактное синтаксическое дерево сформировано.")
 
         # Семантический анализ
-        semantic_analyzer = SemanticAnalyzer(parser.symbol_table)
-        is_semantically_valid = semantic_analyzer.analyze(ast)
+        semantic_analyzer = SemanticAnalyzer(parser.symbol_table, lexer.symbols)
+        with tracked_phase(tracker, 'semantic'):
+            is_semantically_valid = semantic_analyzer.analyze(ast)
         
         if not is_semantically_valid:
             print("\nОбнаружены семантические ошибки:")
@@ -34,18 +46,38 @@ def process_file(file_path):
             return
 
         # Интерпретация
-        interpreter = Interpreter(parser.symbol_table)
-        interpreter.interpret(ast)
+        trace = None
+        reader = InputReader(path=input_path) if input_path else None
+        if trace_path:
+            # При ошибке трасса сохраняется интерпретатором
+            trace = TraceBuffer(error_path=trace_path)
+            trace.bind(ast, lexer.symbols, code)
+            interpreter = TracingInterpreter(parser.symbol_table, lexer.symbols, trace=trace, reader=reader)
+        else:
+            interpreter = Interpreter(parser.symbol_table, lexer.symbols, reader=reader)
+        try:
+            with tracked_phase(tracker, 'execution'):
+                interpreter.interpret(ast)
+        finally:
+            if reader is not None:
+                reader.close()
+        if trace is not None:
+            trace.dump(trace_path)
         
         print("\nПрограмма успешно выполнена.")
         print("Значения переменных:")
-        for var, value in interpreter.variable_values.items():
+        for var, value in interpreter.named_values().items():
             print(f"{var}: {value}")
 
     except FileNotFoundError:
         print(f"Файл {file_path} не найден.")
     except Exception as e:
         print(f"Ошибка при обработке файла: {e}")
+    finally:
+        if tracker is not None:
+            tracker.stop()
+            print("\nПамять по этапам:")
+            print(tracker.format_report())
 
 def main():
     sample_code = '''
@@ -84,11 +116,11 @@ def main():
     parser = SyntaxAnalyzer(tokens)
     ast = parser.parse()
 
-    interpreter = Interpreter(parser.symbol_table)
+    interpreter = Interpreter(parser.symbol_table, lexer.symbols)
     interpreter.interpret(ast)
 
     print("Значения переменных после интерпретации:")
-    for var, value in interpreter.variable_values.items():
+    for var, value in interpreter.named_values().items():
         print(f"{var}: {value}")
 
 if __name__ == "__main__":
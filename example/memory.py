@@ -0,0 +1,156 @@
+import _thread
+import signal
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Этапы обработки программы в порядке выполнения
+PHASES = ('lexing', 'parsing', 'semantic', 'execution')
+
+class MemoryLimitExceeded(Exception):
+    """
+    Этап обработки занял больше памяти, чем разрешено
+    """
+    def __init__(self, phase: str, limit: int, used: int):
+        self.phase = phase
+        self.limit = limit
+        self.used = used
+        super().__init__(f"Превышен лимит памяти на этапе {phase}: "
+                         f"{format_size(used)} при лимите {format_size(limit)}")
+
+def format_size(size: int) -> str:
+    """
+    Размер в байтах в удобочитаемом виде
+    """
+    for unit in ('Б', 'КБ', 'МБ'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'Б' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} ГБ"
+
+def parse_size(text: str) -> int:
+    """
+    Размер вида 512M, 64K, 2G или число байт
+    """
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+class MemoryTracker:
+    """
+    Учёт памяти по этапам обработки с помощью tracemalloc.
+    Для каждого этапа запоминаются пиковый (peak) и оставшийся после этапа (retained)
+    объём памяти относительно начала этапа. Если для этапа задан лимит,
+    фоновый поток следит за памятью и прерывает главный поток при его превышении
+    """
+    def __init__(self, limits: Dict[str, int] = None, poll_interval: float = 0.01):
+        self.limits = limits or {}
+        self.poll_interval = poll_interval
+        self.phases: Dict[str, Dict[str, int]] = {}
+        self.started = False  # tracemalloc запущен этим объектом
+        self.exceeded: Optional[MemoryLimitExceeded] = None
+        self.armed = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+
+    def stop(self):
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Учёт памяти на время выполнения этапа name
+        """
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        limit = self.limits.get(name)
+
+        # Прервать выполнение можно только в главном потоке
+        watchdog = None
+        if limit is not None and threading.current_thread() is threading.main_thread():
+            self.exceeded = None
+            stop = threading.Event()
+            previous_handler = signal.signal(signal.SIGINT, self.on_interrupt)
+            watchdog = threading.Thread(target=self.watch, args=(name, baseline, limit, stop), daemon=True)
+            self.armed = True
+            watchdog.start()
+        try:
+            yield
+        finally:
+            try:
+                if watchdog is not None:
+                    self.armed = False
+                    stop.set()
+                    watchdog.join()
+            finally:
+                if watchdog is not None:
+                    signal.signal(signal.SIGINT, previous_handler)
+                current, peak = tracemalloc.get_traced_memory()
+                self.phases[name] = {'peak': peak - baseline, 'retained': current - baseline}
+
+        # Превышение, которое фоновый поток не успел заметить
+        if limit is not None and peak - baseline > limit:
+            raise MemoryLimitExceeded(name, limit, peak - baseline)
+
+    def watch(self, name: str, baseline: int, limit: int, stop: threading.Event):
+        """
+        Фоновая проверка памяти этапа
+        """
+        while not stop.wait(self.poll_interval):
+            used = tracemalloc.get_traced_memory()[0] - baseline
+            if used > limit:
+                self.exceeded = MemoryLimitExceeded(name, limit, used)
+                _thread.interrupt_main()
+                return
+
+    def on_interrupt(self, signum, frame):
+        """
+        Обработчик SIGINT на время этапа: прерывание от фонового потока
+        превращается в MemoryLimitExceeded, Ctrl+C работает как обычно
+        """
+        if self.exceeded is None:
+            raise KeyboardInterrupt
+        if self.armed:
+            self.armed = False
+            raise self.exceeded
+        # Прерывание пришло после конца этапа: превышение обнаружится по пиковой памяти
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """
+        Память по этапам (в байтах) в порядке выполнения
+        """
+        return {name: dict(self.phases[name]) for name in sorted(self.phases, key=phase_order)}
+
+    def format_report(self) -> str:
+        return '\n'.join(f"{name}: пик {format_size(usage['peak'])}, "
+                         f"осталось {format_size(usage['retained'])}"
+                         for name, usage in self.report().items())
+
+def phase_order(name: str) -> int:
+    return PHASES.index(name) if name in PHASES else len(PHASES)
+
+@contextmanager
+def tracked_phase(tracker: Optional[MemoryTracker], name: str):
+    """
+    Этап с учётом памяти или без него (tracker=None)
+    """
+    if tracker is None:
+        yield
+    else:
+        with tracker.phase(name):
+            yield
@@ -0,0 +1,178 @@
+import gc
+import mmap
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import attrgetter, itemgetter
+from typing import Iterator, List, NamedTuple, Tuple
+from src.lexer import LexicalAnalyzer, Token, TokenType
+from src.symbols import SymbolTable
+
+# Файлы меньше этого размера быстрее разобрать в одном процессе
+MIN_PARALLEL_SIZE = 1 << 20
+
+def split_line_ranges(mm: mmap.mmap, parts: int) -> List[Tuple[int, int, int]]:
+    """
+    Разбиение файла на диапазоны байтов, выровненные по границам строк.
+    Возвращает тройки (начало, конец, номер первой строки диапазона)
+    """
+    size = len(mm)
+    bounds = [0]
+    for k in range(1, parts):
+        target = size * k // parts
+        if target <= bounds[-1]:
+            continue
+        newline = mm.find(b'\n', target)
+        if newline == -1:
+            break
+        bounds.append(newline + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+
+    ranges = []
+    line = 1
+    for start, end in zip(bounds, bounds[1:]):
+        ranges.append((start, end, line))
+        line += mm[start:end].count(b'\n')
+    return ranges
+
+# Типы токенов по их номеру (TokenType.value) для сборки токенов из массивов
+TOKEN_TYPES = {token_type.value: token_type for token_type in TokenType}
+
+def read_text(path: str) -> str:
+    """
+    Чтение файла целиком с той же декодировкой байтов, что у диапазонов
+    (переводы строк не преобразуются)
+    """
+    with open(path, 'rb') as file:
+        return file.read().decode('utf-8')
+
+class TokenChunk(NamedTuple):
+    """
+    Токены диапазона в компактном виде: по массиву на каждое поле токена.
+    Значения склеены через перевод строки (токен не содержит переводов строк),
+    symbols - номера в локальной таблице имён, names - её новые имена
+    """
+    kinds: bytes
+    values: str
+    lines: array
+    columns: array
+    symbols: array
+    names: List[str]
+
+def _lex_range(path: str, start: int, end: int, first_line: int) -> TokenChunk:
+    """
+    Лексический анализ одного диапазона файла (выполняется в процессе пула).
+    Токены передаются обратно массивами, а не объектами: так их быстрее
+    сериализовать и собрать в основном процессе
+    """
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        code = mm[start:end].decode('utf-8')
+
+    lexer = LexicalAnalyzer()
+    tokens = lexer.tokenize(code, first_line)
+    symbols = lexer.symbols
+    return TokenChunk(bytes(map(attrgetter('value'), map(itemgetter(0), tokens))),
+                      '\n'.join(map(itemgetter(1), tokens)),
+                      array('i', map(itemgetter(2), tokens)),
+                      array('i', map(itemgetter(3), tokens)),
+                      array('i', map(itemgetter(4), tokens)),
+                      symbols.names[symbols.keyword_count:])
+
+class ParallelLexicalAnalyzer:
+    """
+    Лексический анализ большого файла в пуле процессов.
+    Строки обрабатываются независимо (комментарии и токены не переходят
+    через перевод строки), поэтому файл делится на диапазоны строк,
+    а результаты склеиваются по порядку
+    """
+    def __init__(self, symbols: SymbolTable = None, workers: int = None,
+                 chunks_per_worker: int = 4):
+        self.symbols = symbols or SymbolTable()
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+
+    def tokenize_file(self, path: str) -> List[Token]:
+        """
+        Разбиение файла на токены с глобальными номерами строк
+        """
+        size = os.path.getsize(path)
+        if size < MIN_PARALLEL_SIZE or self.workers == 1:
+            return LexicalAnalyzer(self.symbols).tokenize(read_text(path))
+
+        with open(path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = split_line_ranges(mm, self.workers * self.chunks_per_worker)
+
+        tokens = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(_lex_range, path, start, end, first_line)
+                       for start, end, first_line in ranges]
+            # Токены не образуют циклов ссылок, а сборщик мусора, запускаемый
+            # при создании миллионов кортежей, занимает большую часть склейки
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                for future in futures:
+                    tokens.extend(self.merge(future.result()))
+            finally:
+                if collecting:
+                    gc.enable()
+        return tokens
+
+    def merge(self, chunk: TokenChunk) -> Iterator[Token]:
+        """
+        Перевод токенов диапазона в общую таблицу имён.
+        Таблица перевода номеров строится один раз на диапазон, токены
+        собираются по мере обхода без промежуточных списков
+        """
+        symbols = self.symbols
+        keyword_count = symbols.keyword_count
+        local_symbols = chunk.symbols
+        remap = [symbols.intern(name) for name in chunk.names]
+        # Если новые имена получили в общей таблице те же номера, что
+        # в локальной (обычно у первого диапазона), перевод не нужен
+        if remap != list(range(keyword_count, keyword_count + len(remap))):
+            # Номера ключевых слов совпадают во всех таблицах; последний элемент
+            # отображает номер -1 (токены без имени) сам в себя
+            remap[:0] = range(keyword_count)
+            remap.append(-1)
+            local_symbols = map(remap.__getitem__, local_symbols)
+
+        fields = zip(map(TOKEN_TYPES.__getitem__, chunk.kinds),
+                     chunk.values.split('\n'), chunk.lines, chunk.columns,
+                     local_symbols)
+        return map(tuple.__new__, repeat(Token), fields)
+
+
+def main():
+    import tempfile
+
+    body = ''.join(f"    X{i % 97} as X{i % 89} plus {i}.5;\n" for i in range(200000))
+    code = "program var\n    X int;\nbegin\n" + body + "    X as 1\nend.\n"
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+        file.write(code)
+        path = file.name
+
+    try:
+        start = time.perf_counter()
+        expected = LexicalAnalyzer().tokenize(code)
+        print(f"1 процесс: {time.perf_counter() - start:.2f} с")
+
+        for workers in (2, 4, 8):
+            if workers > (os.cpu_count() or 1):
+                break
+            start = time.perf_counter()
+            tokens = ParallelLexicalAnalyzer(workers=workers).tokenize_file(path)
+            print(f"{workers} процессов: {time.perf_counter() - start:.2f} с")
+            assert [(t.type, t.value, t.line, t.column) for t in tokens] == \
+                   [(t.type, t.value, t.line, t.column) for t in expected]
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    main()
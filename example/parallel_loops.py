@@ -0,0 +1,334 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Set, Tuple
+from src.parser import ASTNode
+from src.interpreter import Interpreter
+from src.symbols import SymbolTable
+from src.sinks import NullSink
+
+class LoopVerdict(NamedTuple):
+    """
+    Результат анализа зависимостей цикла for
+    """
+    line: int
+    column: int
+    parallel: bool
+    reasons: List[str]  # почему итерации нельзя выполнять независимо
+    indexed: FrozenSet[int] = frozenset()  # массивы, изменяемые в элементе [счетчик]
+
+    def describe(self) -> str:
+        if self.parallel:
+            return f"Цикл на строке {self.line}: итерации независимы"
+        return f"Цикл на строке {self.line}: последовательно - " + '; '.join(self.reasons)
+
+class DependenceAnalyzer:
+    """
+    Поиск зависимостей между итерациями цикла for.
+    Итерации независимы, если тело не меняет счетчик, не выполняет ввод-вывод
+    и не читает переменную, которую оно же изменяет, раньше, чем присвоит ей значение
+    в той же итерации (иначе читается значение из предыдущей итерации).
+    Элементы массива можно менять только по индексу, равному счетчику,
+    и тогда читать этот массив тоже только по такому индексу
+    """
+    def __init__(self, symbols: SymbolTable):
+        self.symbols = symbols
+
+    def analyze(self, node: ASTNode) -> LoopVerdict:
+        counter = node.children[0].value['identifier']
+        self.counter = counter
+        self.reasons: List[str] = []
+        self.writes: Set[int] = set()
+        self.exposed: Set[int] = set()  # читаются до присваивания в итерации
+        self.all_reads: Set[int] = set()  # кроме чтений элемента [счетчик]
+        self.indexed_writes: Set[int] = set()  # массивы, изменяемые в элементе [счетчик]
+        self.scattered_writes: Set[int] = set()  # массивы, изменяемые по другим индексам
+
+        self.scan_statement(node.children[2], {counter})
+
+        name = self.symbols.name
+        if counter in self.writes:
+            self.reasons.append(f"счетчик {name(counter)} изменяется в теле цикла")
+        for variable in sorted((self.writes & self.exposed) - {counter}):
+            self.reasons.append(f"переменная {name(variable)} читается до присваивания "
+                                f"и изменяется в теле (зависимость между итерациями)")
+        for array in sorted(self.scattered_writes):
+            self.reasons.append(f"элементы массива {name(array)} изменяются не по индексу {name(counter)}")
+        for array in sorted((self.indexed_writes & (self.all_reads | self.writes)) - self.scattered_writes):
+            self.reasons.append(f"массив {name(array)} используется не только в элементе [{name(counter)}]")
+        return LoopVerdict(node.value.get('line'), node.value.get('column'),
+                           not self.reasons, self.reasons, frozenset(self.indexed_writes))
+
+    def is_own_element(self, index: ASTNode) -> bool:
+        """
+        Индекс - счетчик цикла: элемент принадлежит текущей итерации
+        """
+        return index.type == 'Identifier' and index.value == self.counter
+
+    def reads(self, node: ASTNode) -> Set[int]:
+        if node is None:
+            return set()
+        if node.type == 'Identifier':
+            return {node.value}
+        if node.type == 'Index':
+            index = node.children[0]
+            if self.is_own_element(index):
+                return {index.value}
+            return {node.value} | self.reads(index)
+        result = set()
+        for child in node.children:
+            result |= self.reads(child)
+        return result
+
+    def use(self, expression: ASTNode, defined: Set[int]):
+        read = self.reads(expression)
+        self.all_reads |= read
+        self.exposed |= read - defined
+
+    def scan_statement(self, node: ASTNode, defined: Set[int]) -> Set[int]:
+        """
+        Обход оператора; возвращает переменные, которым гарантированно
+        присвоено значение в текущей итерации после его выполнения
+        """
+        if node.type == 'Assignment':
+            self.use(node.children[0], defined)
+            if len(node.children) > 1:
+                # Запись элемента не определяет массив целиком
+                index = node.children[1]
+                self.use(index, defined)
+                if self.is_own_element(index):
+                    self.indexed_writes.add(node.value['identifier'])
+                else:
+                    self.scattered_writes.add(node.value['identifier'])
+                return defined
+            self.writes.add(node.value['identifier'])
+            return defined | {node.value['identifier']}
+
+        if node.type == 'ConditionalStatement':
+            self.use(node.children[0], defined)
+            then_defined = self.scan_statement(node.children[1], set(defined))
+            else_defined = defined
+            if len(node.children) > 2 and node.children[2]:
+                else_defined = self.scan_statement(node.children[2], set(defined))
+            return then_defined & else_defined
+
+        if node.type == 'ForLoop':
+            defined = self.scan_statement(node.children[0], defined)
+            self.use(node.children[1], defined)
+            # Тело может не выполниться ни разу
+            self.scan_statement(node.children[2], set(defined))
+            return defined
+
+        if node.type == 'WhileLoop':
+            self.use(node.children[0], defined)
+            self.scan_statement(node.children[1], set(defined))
+            return defined
+
+        if node.type == 'Block':
+            for statement in node.children:
+                defined = self.scan_statement(statement, defined)
+            return defined
+
+        if node.type in ('WriteStatement', 'WriteLineStatement'):
+            for expression in node.children:
+                self.use(expression, defined)
+            if not any(reason.startswith('вывод') for reason in self.reasons):
+                statement = 'write()' if node.type == 'WriteStatement' else 'writeln'
+                self.reasons.append(f"вывод {statement} зависит от порядка итераций")
+            return defined
+
+        if node.type == 'ReadStatement':
+            if not any(reason.startswith('ввод') for reason in self.reasons):
+                self.reasons.append("ввод readln зависит от порядка итераций")
+            return defined
+
+        return defined
+
+def analyze_loops(ast: ASTNode, symbols: SymbolTable) -> List[LoopVerdict]:
+    """
+    Анализ всех циклов for программы
+    """
+    analyzer = DependenceAnalyzer(symbols)
+    verdicts = []
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if node.type == 'ForLoop':
+            verdicts.append(analyzer.analyze(node))
+        stack.extend(reversed(node.children))
+    return verdicts
+
+class _TrackingInterpreter(Interpreter):
+    """
+    Интерпретатор, запоминающий переменные, которым присваивались значения
+    (присваивания отдельным элементам массивов не учитываются)
+    """
+    def __init__(self, symbol_table: Dict[int, Dict], symbols: SymbolTable):
+        super().__init__(symbol_table, symbols, output=NullSink())
+        self.written: Set[int] = set()
+
+    def execute_assignment(self, node: ASTNode):
+        if len(node.children) == 1:
+            self.written.add(node.value['identifier'])
+        super().execute_assignment(node)
+
+def _run_chunk(node: ASTNode, symbol_table: Dict[int, Dict], symbols: SymbolTable,
+               values: Dict[int, Any], counter_var: int, first, last,
+               indexed: Set[int]) -> Tuple[Dict[int, Any], Dict[int, Any]]:
+    """
+    Выполнение итераций first..last (выполняется в процессе пула).
+    Возвращает значения переменных, изменённых в этих итерациях,
+    и участки first..last массивов, изменяемых по индексу счетчика
+    """
+    interpreter = _TrackingInterpreter(symbol_table, symbols)
+    interpreter.variable_values = values
+    values[counter_var] = first
+    interpreter.run_for_iterations(node, counter_var, last)
+    written = {variable: values[variable] for variable in interpreter.written}
+    sections = {array: values[array][int(first):int(last) + 1] for array in indexed}
+    return written, sections
+
+class ParallelInterpreter(Interpreter):
+    """
+    Интерпретатор, выполняющий циклы for с независимыми итерациями
+    частями в пуле процессов. Итоговые значения переменных собираются
+    по порядку частей: побеждает значение из последней изменившей переменную части
+    """
+    def __init__(self, symbol_table: Dict[int, Dict], symbols: SymbolTable,
+                 workers: int = None, min_iterations: int = 10000,
+                 chunks_per_worker: int = 4, **options):
+        super().__init__(symbol_table, symbols, **options)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_iterations = min_iterations
+        self.chunks_per_worker = chunks_per_worker
+        self.analyzer = DependenceAnalyzer(symbols)
+        self.verdicts: Dict[int, LoopVerdict] = {}
+        # Место цикла -> как он выполнялся последний раз
+        self.loop_reports: Dict[Tuple[int, int], str] = {}
+        self.pool = None
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def execute_for_loop(self, node: ASTNode):
+        verdict = self.verdicts.get(id(node))
+        if verdict is None:
+            verdict = self.verdicts[id(node)] = self.analyzer.analyze(node)
+
+        self.execute_statement(node.children[0])
+        counter_var = node.children[0].value['identifier']
+        limit = self.evaluate_expression(node.children[1])
+        start = self.variable_values[counter_var]
+
+        iterations = 0
+        reason = None
+        if not verdict.parallel:
+            reason = '; '.join(verdict.reasons)
+        elif self.workers < 2:
+            reason = "доступен один процесс"
+        elif self.max_steps is not None or self.time_limit is not None:
+            reason = "заданы ограничения выполнения"
+        elif isinstance(start, bool) or not float(start).is_integer():
+            reason = "начальное значение счетчика не целое"
+        else:
+            iterations = math.floor(limit - start) + 1 if start <= limit else 0
+            if iterations < self.min_iterations:
+                reason = f"мало итераций ({iterations})"
+
+        location = (verdict.line, verdict.column)
+        if reason:
+            self.loop_reports[location] = f"последовательно: {reason}"
+            self.run_for_iterations(node, counter_var, limit)
+            return
+
+        self.loop_reports[location] = f"параллельно: {iterations} итераций, процессов: {self.workers}"
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        chunks = min(iterations, self.workers * self.chunks_per_worker)
+        size = -(-iterations // chunks)
+        bounds = [(start + low, start + min(low + size, iterations) - 1)
+                  for low in range(0, iterations, size)]
+        futures = [
+            self.pool.submit(_run_chunk, node, self.symbol_table, self.symbols,
+                             dict(self.variable_values), counter_var,
+                             first, last, verdict.indexed)
+            for first, last in bounds
+        ]
+        for (first, last), future in zip(bounds, futures):
+            written, sections = future.result()
+            self.variable_values.update(written)
+            for array, section in sections.items():
+                self.variable_values[array][int(first):int(last) + 1] = section
+        self.variable_values[counter_var] = start + iterations
+
+    def report(self) -> List[str]:
+        """
+        Вердикт анализа и способ выполнения для каждого выполненного цикла
+        """
+        lines = []
+        for verdict in sorted(self.verdicts.values(), key=lambda verdict: (verdict.line, verdict.column)):
+            location = (verdict.line, verdict.column)
+            if verdict.parallel:
+                lines.append(f"{verdict.describe()} ({self.loop_reports.get(location, 'не выполнялся')})")
+            else:
+                lines.append(verdict.describe())
+        return lines
+
+
+def main():
+    from src.lexer import LexicalAnalyzer
+    from src.parser import SyntaxAnalyzer
+
+    sample_code = '''
+    program var
+        I int;
+        J int;
+        T float;
+        U float;
+        S float;
+    begin
+        for I as 1 to 200000 do
+            [T as I mult I;
+            U as T div 3;
+            for J as 1 to 3 do
+                T as T plus J];
+        for I as 1 to 10 do
+            S as S plus I;
+        write(S)
+    end.
+    '''
+
+    lexer = LexicalAnalyzer()
+    parser = SyntaxAnalyzer(lexer.tokenize(sample_code), debug=False)
+    ast = parser.parse()
+
+    for verdict in analyze_loops(ast, lexer.symbols):
+        print(verdict.describe())
+
+    start = time.perf_counter()
+    sequential = Interpreter(parser.symbol_table, lexer.symbols)
+    sequential.interpret(ast)
+    print(f"Последовательно: {time.perf_counter() - start:.2f} с, {sequential.named_values()}")
+
+    workers = max(2, os.cpu_count() or 1)
+    with ParallelInterpreter(parser.symbol_table, lexer.symbols, workers=workers) as interpreter:
+        start = time.perf_counter()
+        interpreter.interpret(ast)
+        print(f"Параллельно: {time.perf_counter() - start:.2f} с, {interpreter.named_values()}")
+        for line in interpreter.report():
+            print(line)
+
+if __name__ == "__main__":
+    main()
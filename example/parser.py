@@ -8,10 +8,12 @@ class ASTNode:
         self.children = children or []
 
 class SyntaxAnalyzer:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: List[Token], debug: bool = True):
         self.tokens = tokens
         self.current_token_index = 0
-        self.symbol_table: Dict[str, Dict] = {}
+        self.debug = debug  # Печать каждого проверяемого токена
+        # Таблица символов программы: номер имени -> сведения о переменной
+        self.symbol_table: Dict[int, Dict] = {}
 
     def parse(self) -> ASTNode:
         """
@@ -82,20 +84,31 @@ class SyntaxAnalyzer:
         declarations = ASTNode('VariableDeclarations')
     
         while self.current_token().type == TokenType.IDENTIFIER:
-            identifier = self.current_token().value
+            identifier = self.current_token().symbol
             self.consume_token('IDENTIFIER')  # Имя переменной
             
             self.consume_token('KEYWORD')  # Тип переменной (int, float, bool)
             var_type = self.tokens[self.current_token_index - 1].value
+            entry = {'type': var_type}
+            
+            # Массив: тип[размер]
+            if self.is_token('DELIMITER', '['):
+                self.consume_token('DELIMITER', '[')
+                size = self.current_token().value
+                self.consume_token('NUMBER')
+                if not size.isdigit() or int(size) == 0:
+                    raise SyntaxError(f"Размер массива должен быть положительным целым числом, получено {size}")
+                entry['size'] = int(size)
+                self.consume_token('DELIMITER', ']')
             
             self.consume_token('DELIMITER', ';')  # Конец объявления
             
             # Добавление в таблицу символов
-            self.symbol_table[identifier] = {'type': var_type}
+            self.symbol_table[identifier] = entry
             
             declarations.children.append(
                 ASTNode('VariableDeclaration', 
-                        value={'identifier': identifier, 'type': var_type})
+                        value={'identifier': identifier, **entry})
             )
     
         return declarations
@@ -104,6 +117,7 @@ class SyntaxAnalyzer:
         """
         Парсинг цикла for
         """
+        start = self.current_token()
         self.consume_token('KEYWORD', 'for')
         
         # Инициализация счетчика
@@ -120,12 +134,14 @@ class SyntaxAnalyzer:
         body = self.parse_statement()
         
         return ASTNode('ForLoop', 
+                    value={'line': start.line, 'column': start.column},
                     children=[initialization, limit, body])
 
     def parse_while_loop(self) -> ASTNode:
         """
         Парсинг цикла while
         """
+        start = self.current_token()
         self.consume_token('KEYWORD', 'while')
         
         # Условие цикла
@@ -137,6 +153,7 @@ class SyntaxAnalyzer:
         body = self.parse_statement()
         
         return ASTNode('WhileLoop', 
+                    value={'line': start.line, 'column': start.column},
                     children=[condition, body])
 
     def parse_statement_block(self) -> ASTNode:
@@ -166,6 +183,12 @@ class SyntaxAnalyzer:
         if self.is_token('KEYWORD', 'write'):
             return self.parse_write_statement()
 
+        # Ввод и построчный вывод
+        if self.is_token('KEYWORD', 'readln'):
+            return self.parse_read_statement()
+        if self.is_token('KEYWORD', 'writeln'):
+            return self.parse_writeln_statement()
+
         # Условный оператор
         if self.is_token('KEYWORD', 'if'):
             return self.parse_conditional()
@@ -192,16 +215,36 @@ class SyntaxAnalyzer:
         """
         Парсинг операции присваивания
         """
-        identifier = self.current_token().value
+        start = self.current_token()
+        identifier = start.symbol
         self.consume_token('IDENTIFIER')
         
+        # Присваивание элементу массива: второй потомок - индекс
+        index = self.parse_index() if self.is_indexed(identifier) else None
+        
         self.consume_token('OPERATOR', 'as')
         
         expression = self.parse_expression()
         
         return ASTNode('Assignment', 
-                       value={'identifier': identifier},
-                       children=[expression])
+                       value={'identifier': identifier, 'line': start.line, 'column': start.column},
+                       children=[expression, index] if index else [expression])
+
+    def is_indexed(self, identifier: int) -> bool:
+        """
+        Следует ли за именем индекс. Скобка после имени массива всегда
+        считается индексом, после скалярной переменной - началом блока
+        """
+        return 'size' in self.symbol_table.get(identifier, {}) and self.is_token('DELIMITER', '[')
+
+    def parse_index(self) -> ASTNode:
+        """
+        Парсинг индекса элемента массива в квадратных скобках
+        """
+        self.consume_token('DELIMITER', '[')
+        index = self.parse_expression()
+        self.consume_token('DELIMITER', ']')
+        return index
 
     def parse_expression(self) -> ASTNode:
         """
@@ -221,9 +264,15 @@ class SyntaxAnalyzer:
 
         # Идентификатор
         if self.is_token('IDENTIFIER'):
-            value = self.current_token().value
+            value = self.current_token().symbol
             self.consume_token('IDENTIFIER')
             
+            # Элемент массива
+            if self.is_indexed(value):
+                operand = ASTNode('Index', value=value, children=[self.parse_index()])
+            else:
+                operand = ASTNode('Identifier', value=value)
+            
             # Проверка на арифметическую операцию
             if self.is_token('OPERATOR') and self.current_token().value in {'mult', 'div', 'plus', 'min'}:
                 op = self.current_token().value
@@ -232,12 +281,9 @@ class SyntaxAnalyzer:
                 
                 return ASTNode('BinaryOperation', 
                             value={'operator': op},
-                            children=[
-                                ASTNode('Identifier', value=value),
-                                right
-                            ])
+                            children=[operand, right])
             
-            return ASTNode('Identifier', value=value)
+            return operand
 
         # Если ничего не подошло
         raise SyntaxError(f"Неожиданный токен в выражении: {self.current_token().value}")
@@ -246,6 +292,7 @@ class SyntaxAnalyzer:
         """
         Парсинг оператора write()
         """
+        start = self.current_token()
         self.consume_token('KEYWORD', 'write')  # Исправлено с IDENTIFIER на KEYWORD
         self.consume_token('DELIMITER', '(')
         
@@ -254,7 +301,59 @@ class SyntaxAnalyzer:
         
         self.consume_token('DELIMITER', ')')
         
-        return ASTNode('WriteStatement', children=[expression])
+        return ASTNode('WriteStatement', 
+                    value={'line': start.line, 'column': start.column},
+                    children=[expression])
+
+    def parse_read_statement(self) -> ASTNode:
+        """
+        Парсинг оператора readln(переменная, элемент[индекс], ...)
+        """
+        start = self.current_token()
+        self.consume_token('KEYWORD', 'readln')
+        self.consume_token('DELIMITER', '(')
+        
+        targets = [self.parse_read_target()]
+        while self.is_token('DELIMITER', ','):
+            self.consume_token('DELIMITER', ',')
+            targets.append(self.parse_read_target())
+        
+        self.consume_token('DELIMITER', ')')
+        
+        return ASTNode('ReadStatement',
+                    value={'line': start.line, 'column': start.column},
+                    children=targets)
+
+    def parse_read_target(self) -> ASTNode:
+        """
+        Переменная или элемент массива, в которые читается значение
+        """
+        identifier = self.current_token().symbol
+        self.consume_token('IDENTIFIER')
+        if self.is_indexed(identifier):
+            return ASTNode('Index', value=identifier, children=[self.parse_index()])
+        return ASTNode('Identifier', value=identifier)
+
+    def parse_writeln_statement(self) -> ASTNode:
+        """
+        Парсинг оператора writeln или writeln(выражение, ...)
+        """
+        start = self.current_token()
+        self.consume_token('KEYWORD', 'writeln')
+        
+        arguments = []
+        if self.is_token('DELIMITER', '('):
+            self.consume_token('DELIMITER', '(')
+            if not self.is_token('DELIMITER', ')'):
+                arguments.append(self.parse_expression())
+                while self.is_token('DELIMITER', ','):
+                    self.consume_token('DELIMITER', ',')
+                    arguments.append(self.parse_expression())
+            self.consume_token('DELIMITER', ')')
+        
+        return ASTNode('WriteLineStatement',
+                    value={'line': start.line, 'column': start.column},
+                    children=arguments)
 
 
     def current_token(self) -> Token:
@@ -267,7 +366,8 @@ class SyntaxAnalyzer:
 
     def consume_token(self, expected_type: str = None, expected_value: str = None):
         current = self.current_token()
-        print(f"Проверяется токен: {current.type}, значение: {current.value}")  # Для отладки
+        if self.debug:
+            print(f"Проверяется токен: {current.type}, значение: {current.value}")  # Для отладки
         if expected_type and current.type != TokenType[expected_type]:
             raise SyntaxError(f"Ожидался токен типа {expected_type}, получен {current.type}")
         if expected_value and current.value != expected_value:
@@ -278,6 +378,7 @@ class SyntaxAnalyzer:
         """
         Парсинг условного оператора if-then-else с расширенной поддержкой
         """
+        start = self.current_token()
         self.consume_token('KEYWORD', 'if')
         
         # Условие
@@ -295,6 +396,7 @@ class SyntaxAnalyzer:
             false_branch = self.parse_statement()
         
         return ASTNode('ConditionalStatement', 
+                    value={'line': start.line, 'column': start.column},
                     children=[condition, true_branch, false_branch] if false_branch else [condition, true_branch])
 
 
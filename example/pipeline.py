@@ -0,0 +1,135 @@
+import io
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
+from src.lexer import LexicalAnalyzer, Token
+from src.parser import ASTNode
+from src.ll1 import TableParser
+from src.semantic_analyzer import SemanticAnalyzer
+from src.interpreter import BudgetExceeded, Interpreter
+from src.symbols import SymbolTable
+from src.sinks import MemorySink
+from src.ir import IRExecutor, compile_ir
+from src.memory import MemoryLimitExceeded, MemoryTracker, tracked_phase
+from src.runtime_io import InputReader
+
+class CompiledProgram(NamedTuple):
+    """
+    Результат лексического, синтаксического и семантического анализа
+    """
+    tokens: List[Token]
+    ast: ASTNode
+    symbol_table: Dict[int, Dict]
+    symbols: SymbolTable
+    errors: List[str]
+
+def compile_source(code: str, tracker: MemoryTracker = None) -> CompiledProgram:
+    """
+    Анализ текста программы без печати промежуточных результатов
+    (разбор - TableParser по таблице из grammar.txt).
+    Лексические и синтаксические ошибки возвращаются в errors вместе с семантическими.
+    tracker - учёт памяти по этапам (при превышении лимита - MemoryLimitExceeded)
+    """
+    lexer = LexicalAnalyzer()
+    try:
+        with tracked_phase(tracker, 'lexing'):
+            tokens = lexer.tokenize(code)
+        with tracked_phase(tracker, 'parsing'):
+            parser = TableParser(tokens)
+            ast = parser.parse()
+    except SyntaxError as e:
+        return CompiledProgram([], None, {}, lexer.symbols, [str(e)])
+
+    semantic_analyzer = SemanticAnalyzer(parser.symbol_table, lexer.symbols)
+    with tracked_phase(tracker, 'semantic'):
+        semantic_analyzer.validate_node(ast)
+    return CompiledProgram(tokens, ast, parser.symbol_table, lexer.symbols,
+                           semantic_analyzer.errors)
+
+# Повторно присланные программы не разбираются заново
+compile_cached = lru_cache(maxsize=256)(compile_source)
+
+def run_program(program: CompiledProgram, max_steps: Optional[int] = None,
+                time_limit: Optional[float] = None, engine: str = 'ast',
+                tracker: MemoryTracker = None, input_data: str = '') -> Dict[str, Any]:
+    """
+    Выполнение разобранной программы; результат пригоден для сериализации в JSON.
+    engine - 'ast' (обход дерева) или 'ir' (оптимизированный трёхадресный код).
+    input_data - ввод для readln (стандартный ввод процесса не читается);
+    строки writeln попадают в output текстом.
+    При превышении ограничений статус 'budget_exceeded', в budget - причина и место,
+    в variables - значения переменных на момент остановки.
+    При превышении лимита памяти на выполнение статус 'memory_exceeded'
+    """
+    result = {
+        'status': 'error' if program.errors else 'ok',
+        'tokens': [[token.type.name, token.value, token.line, token.column]
+                   for token in program.tokens],
+        'errors': list(program.errors),
+        'output': [],
+        'variables': {},
+    }
+    if program.errors:
+        return result
+
+    output = MemorySink()
+    reader = InputReader(io.BytesIO(input_data.encode('utf-8')))
+    if engine == 'ir':
+        interpreter = IRExecutor(compile_ir(program.ast, program.symbols), output=output,
+                                 max_steps=max_steps, time_limit=time_limit, reader=reader)
+    else:
+        interpreter = Interpreter(program.symbol_table, program.symbols, max_steps=max_steps,
+                                  time_limit=time_limit, output=output, reader=reader)
+    try:
+        with tracked_phase(tracker, 'execution'):
+            if engine == 'ir':
+                interpreter.run()
+            else:
+                interpreter.start_budget()
+                interpreter.execute_node(program.ast)
+    except BudgetExceeded as e:
+        result['status'] = 'budget_exceeded'
+        result['errors'].append(str(e))
+        result['budget'] = e.as_dict()
+    except MemoryLimitExceeded as e:
+        result['status'] = 'memory_exceeded'
+        result['errors'].append(str(e))
+    except Exception as e:
+        result['status'] = 'error'
+        result['errors'].append(f"Ошибка выполнения: {e}")
+    result['output'] = output.values
+    name = program.symbols.name
+    result['variables'] = {name(symbol): plain_value(value)
+                           for symbol, value in interpreter.variable_values.items()}
+    return result
+
+def plain_value(value: Any) -> Any:
+    """
+    Массивы numpy переводятся в списки для сериализации в JSON
+    """
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+def run_source(code: str, use_cache: bool = True, max_steps: Optional[int] = None,
+               time_limit: Optional[float] = None, engine: str = 'ast',
+               track_memory: bool = False,
+               memory_limits: Optional[Dict[str, int]] = None,
+               input_data: str = '') -> Dict[str, Any]:
+    """
+    Полный цикл обработки текста программы: анализ и выполнение.
+    track_memory - учёт памяти по этапам (в result['memory'] - пик и остаток в байтах),
+    memory_limits - лимиты памяти этапов lexing, parsing, semantic, execution в байтах.
+    При учёте памяти кэш разобранных программ не используется
+    """
+    if not track_memory and not memory_limits:
+        program = compile_cached(code) if use_cache else compile_source(code)
+        return run_program(program, max_steps, time_limit, engine, input_data=input_data)
+
+    with MemoryTracker(memory_limits) as tracker:
+        try:
+            program = compile_source(code, tracker)
+        except MemoryLimitExceeded as e:
+            result = {'status': 'memory_exceeded', 'tokens': [], 'errors': [str(e)],
+                      'output': [], 'variables': {}}
+        else:
+            result = run_program(program, max_steps, time_limit, engine, tracker, input_data)
+    result['memory'] = tracker.report()
+    return result
@@ -0,0 +1,204 @@
+import mmap
+import os
+import sys
+from typing import Any, BinaryIO, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # без numpy массивов нет, скалярный ввод работает
+    np = None
+
+# Размер блока опережающего чтения, байт
+CHUNK_SIZE = 1 << 20
+
+def parse_bool(word: bytes) -> bool:
+    if word == b'true':
+        return True
+    if word == b'false':
+        return False
+    raise ValueError(word)
+
+# Преобразование слова ввода в значение переменной данного типа
+PARSERS = {'int': int, 'float': float, 'bool': parse_bool}
+
+class InputReader:
+    """
+    Ввод оператора readln: значения разделяются любыми пробельными символами,
+    в том числе переводами строк, так что одно readln может читать значения
+    с нескольких строк и наоборот.
+    Ввод читается блоками по chunk_size байт из потока (по умолчанию - стандартный ввод)
+    или из файла path, отображённого в память. Каждый блок разбивается на слова
+    одним вызовом split, массив заполняется всей пачкой слов сразу
+    """
+    def __init__(self, stream: BinaryIO = None, path: str = None, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.file = None
+        self.map = None
+        self.offset = 0  # позиция следующего блока в отображённом файле
+        if path is not None:
+            self.file = open(path, 'rb')
+            if os.fstat(self.file.fileno()).st_size:
+                self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.words: List[bytes] = []
+        self.position = 0  # следующее непрочитанное слово в words
+        self.tail = b''  # начало слова, разрезанного границей блока
+        self.finished = False
+        self.count = 0  # прочитано значений
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read_block(self) -> bytes:
+        if self.map is not None:
+            block = self.map[self.offset:self.offset + self.chunk_size]
+            self.offset += len(block)
+            return block
+        if self.file is not None:  # пустой файл
+            return b''
+        stream = self.stream if self.stream is not None else sys.stdin.buffer
+        # read1 не ждёт заполнения всего блока: при вводе с клавиатуры строка доступна сразу
+        return getattr(stream, 'read1', stream.read)(self.chunk_size)
+
+    def fill(self) -> bool:
+        """
+        Чтение слов следующего блока; False - ввод закончился
+        """
+        while not self.finished:
+            block = self.read_block()
+            if block:
+                data = self.tail + block
+                words = data.split()
+                # Последнее слово могло продолжиться в следующем блоке
+                self.tail = words.pop() if words and not data[-1:].isspace() else b''
+            else:
+                self.finished = True
+                words = self.tail.split()
+                self.tail = b''
+            if words:
+                self.words = words
+                self.position = 0
+                return True
+        return False
+
+    def next_word(self) -> bytes:
+        if self.position >= len(self.words) and not self.fill():
+            raise EOFError(f"readln: входные данные закончились (прочитано значений: {self.count})")
+        word = self.words[self.position]
+        self.position += 1
+        self.count += 1
+        return word
+
+    def read_value(self, var_type: str) -> Any:
+        """
+        Следующее значение для переменной типа var_type
+        """
+        word = self.next_word()
+        try:
+            return PARSERS[var_type](word)
+        except ValueError:
+            raise ValueError(f"readln: значение {self.count} ({word.decode(errors='replace')}) "
+                             f"не является значением типа {var_type}") from None
+
+    def read_array(self, array, var_type: str):
+        """
+        Заполнение массива следующими len(array) значениями
+        """
+        filled, size = 0, len(array)
+        while filled < size:
+            if self.position >= len(self.words) and not self.fill():
+                raise EOFError(f"readln: входные данные закончились на элементе {filled} "
+                               f"массива из {size} (прочитано значений: {self.count})")
+            take = min(size - filled, len(self.words) - self.position)
+            batch = self.words[self.position:self.position + take]
+            try:
+                array[filled:filled + take] = np.fromiter(map(PARSERS[var_type], batch), array.dtype, take)
+            except ValueError:
+                # Неверное значение ищется по одному только после неудачи всей пачки
+                for _ in batch:
+                    self.read_value(var_type)
+                raise
+            self.position += take
+            self.count += take
+            filled += take
+
+def format_value(value: Any) -> str:
+    """
+    Значение в выводе writeln: логические - true/false, массив - элементы через пробел
+    """
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if hasattr(value, 'tolist'):
+        return ' '.join(map(format_value if value.dtype == bool else str, value.tolist()))
+    return str(value)
+
+def format_line(values: Iterable[Any]) -> str:
+    """
+    Строка вывода writeln
+    """
+    return ' '.join(map(format_value, values)) + '\n'
+
+def main():
+    import tempfile
+    import time
+    from src.lexer import LexicalAnalyzer
+    from src.ll1 import TableParser
+    from src.interpreter import Interpreter
+    from src.sinks import MemorySink
+
+    count, size = 2_000_000, 500_000
+    sample_code = f'''
+    program var
+        V float[{size}];
+        S float;
+        X float;
+        I int;
+    begin
+        for I as 1 to {count // size} do
+            readln(V);
+        for I as 1 to 1000 do
+            [readln(X); S as S plus X];
+        writeln(S, V[0])
+    end.
+    '''
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+        for start in range(0, count + 1000, 1000):
+            file.write(' '.join(str(value * 0.25) for value in range(start, start + 1000)) + '\n')
+        path = file.name
+
+    try:
+        megabytes = os.path.getsize(path) / (1 << 20)
+        start = time.perf_counter()
+        with open(path, 'rb') as file:
+            words = file.read().split()
+        baseline = time.perf_counter() - start
+        print(f"Файл: {megabytes:.1f} МБ, {len(words)} значений; чтение и split: {baseline:.2f} с")
+
+        lexer = LexicalAnalyzer()
+        parser = TableParser(lexer.tokenize(sample_code))
+        ast = parser.parse()
+        output = MemorySink()
+        with InputReader(path=path) as reader:
+            interpreter = Interpreter(parser.symbol_table, lexer.symbols, output=output, reader=reader)
+            start = time.perf_counter()
+            interpreter.interpret(ast)
+            elapsed = time.perf_counter() - start
+        print(f"readln: {elapsed:.2f} с, {megabytes / elapsed:.0f} МБ/с; writeln: {output.values[-1]}")
+    finally:
+        os.unlink(path)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,74 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from src.parser import ASTNode, TokenType
+from src.symbols import SymbolTable
+
+# Типы, допустимые в write() и writeln, и числовые типы
+ALLOWED_TYPES = ('int', 'float', 'bool')
+NUMERIC_TYPES = ('int', 'float')
+# Тип переменной -> типы выражений, которые ей можно присвоить
+TYPE_COMPATIBILITY = {
+    'int': ('int',),
+    'float': ('int', 'float'),
+    'bool': ('bool',)
+}
+
+# Сообщения об ошибках; те же сообщения выдаёт проверка без AST (src.validator)
+
+def undeclared_message(name: str) -> str:
+    return f"Необъявленная переменная {name}"
+
+def redeclared_message(name: str) -> str:
+    return f"Переменная {name} объявлена дважды"
+
+def incompatible_types_message(name: str, var_type: str, expression_type: str) -> str:
+    return (f"Несовместимые типы при присваивании. "
+            f"Переменная {name} типа {var_type}, выражение типа {expression_type}")
+
+def incompatible_sizes_message(name: str, element: bool, size: Optional[int],
+                               expression_size: int) -> str:
+    """
+    Присваивание массива элементу массива (element), скаляру или массиву другого размера
+    """
+    if element:
+        target = f"Элемент массива {name} - скаляр"
+    elif size:
+        target = f"Переменная {name} - массив из {size} элементов"
+    else:
+        target = f"Переменная {name} - скаляр"
+    return (f"Несовместимые размеры при присваивании. {target}, "
+            f"выражение - массив из {expression_size} элементов")
+
+def index_type_message(name: str, index_type: str) -> str:
+    return f"Индекс массива {name} должен быть целым, получен тип {index_type}"
+
+def index_bounds_message(index: str, name: str, size: int) -> str:
+    return f"Индекс {index} вне границ массива {name} из {size} элементов"
+
+def array_not_allowed_message(context: str) -> str:
+    return f"{context} не может быть массивом"
+
+def size_mismatch_message(operator: str, left_size: int, right_size: int) -> str:
+    return f"Несовпадение размеров массивов в операции {operator}: {left_size} и {right_size} элементов"
+
+def comparison_types_message(left_type: str, right_type: str) -> str:
+    return f"Сравнение не может быть выполнено для типов {left_type} и {right_type}"
+
+def output_type_message(statement: str, expression_type: str) -> str:
+    return f"Недопустимый тип для {statement}: {expression_type}. Разрешены: {', '.join(ALLOWED_TYPES)}"
+
+def counter_message(name: str) -> str:
+    return f"Счетчик цикла {name} должен быть скалярной переменной"
+
+def limit_type_message(limit_type: str) -> str:
+    return f"Предел цикла должен быть числом, получен тип {limit_type}"
+
+def loop_condition_message(condition_type: str) -> str:
+    return f"Условие цикла должно быть булевым, получен тип {condition_type}"
 
 class SemanticAnalyzer:
-    def __init__(self, symbol_table: Dict[str, Dict]):
+    def __init__(self, symbol_table: Dict[int, Dict], symbols: SymbolTable):
         self.symbol_table = symbol_table
+        self.symbols = symbols
         self.errors = []
 
     def analyze(self, ast: ASTNode):
@@ -49,7 +114,7 @@ class SemanticAnalyzer:
             
             # Проверка на повторное объявление
             if identifier in declared_identifiers:
-                self.errors.append(f"Переменная {identifier} объявлена дважды")
+                self.errors.append(redeclared_message(self.symbols.name(identifier)))
             declared_identifiers.add(identifier)
 
     def validate_statement(self, node: ASTNode):
@@ -69,20 +134,43 @@ class SemanticAnalyzer:
                 self.validate_statement(statement)
         elif node.type == 'WriteStatement':
             self.validate_write_statement(node)
+        elif node.type == 'ReadStatement':
+            self.validate_read_statement(node)
+        elif node.type == 'WriteLineStatement':
+            self.validate_writeln_statement(node)
 
     def validate_write_statement(self, node: ASTNode):
         """
         Проверка корректности оператора write()
         """
         expression_type = self.infer_expression_type(node.children[0])
+        self.require_scalar(node.children[0], "Аргумент write()")
         
         # Проверяем, что тип выражения допустим для вывода
-        allowed_types = ['int', 'float', 'bool']
-        if expression_type not in allowed_types:
-            self.errors.append(
-                f"Недопустимый тип для write(): {expression_type}. "
-                f"Разрешены: {', '.join(allowed_types)}"
-            )
+        if expression_type not in ALLOWED_TYPES:
+            self.errors.append(output_type_message('write()', expression_type))
+
+    def validate_read_statement(self, node: ASTNode):
+        """
+        Проверка оператора readln: читать можно в объявленные переменные,
+        элементы массивов и массивы целиком
+        """
+        for target in node.children:
+            identifier = target.value
+            if identifier not in self.symbol_table:
+                self.errors.append(undeclared_message(self.symbols.name(identifier)))
+            elif target.type == 'Index':
+                self.validate_index(identifier, target.children[0])
+
+    def validate_writeln_statement(self, node: ASTNode):
+        """
+        Проверка оператора writeln: в отличие от write(), массивы выводятся целиком
+        """
+        for expression in node.children:
+            expression_type = self.infer_expression_type(expression)
+            self.infer_expression_shape(expression)
+            if expression_type not in ALLOWED_TYPES:
+                self.errors.append(output_type_message('writeln', expression_type))
 
     def validate_assignment(self, node: ASTNode):
         """
@@ -92,18 +180,74 @@ class SemanticAnalyzer:
         
         # Проверка, что переменная объявлена
         if identifier not in self.symbol_table:
-            self.errors.append(f"Необъявленная переменная {identifier}")
+            self.errors.append(undeclared_message(self.symbols.name(identifier)))
             return
 
         var_type = self.symbol_table[identifier]['type']
         expression_type = self.infer_expression_type(node.children[0])
         
         if not self.is_type_compatible(var_type, expression_type):
-            self.errors.append(
-                f"Несовместимые типы при присваивании. "
-                f"Переменная {identifier} типа {var_type}, "
-                f"выражение типа {expression_type}"
-            )
+            self.errors.append(incompatible_types_message(self.symbols.name(identifier),
+                                                          var_type, expression_type))
+
+        # Массиву можно присвоить массив того же размера или скаляр (заполнение),
+        # элементу массива и скалярной переменной - только скаляр
+        if len(node.children) > 1:
+            self.validate_index(identifier, node.children[1])
+            target_shape = None
+        else:
+            target_shape = self.variable_shape(identifier)
+        expression_shape = self.infer_expression_shape(node.children[0])
+        if expression_shape is not None and expression_shape != target_shape:
+            self.errors.append(incompatible_sizes_message(
+                self.symbols.name(identifier), len(node.children) > 1,
+                target_shape[0] if target_shape else None, expression_shape[0]))
+
+    def validate_index(self, array: int, index: ASTNode):
+        """
+        Проверка индекса элемента массива (нумерация с нуля)
+        """
+        name = self.symbols.name(array)
+        index_type = self.infer_expression_type(index)
+        if index_type != 'int':
+            self.errors.append(index_type_message(name, index_type))
+        self.require_scalar(index, f"Индекс массива {name}")
+
+        size = self.symbol_table[array]['size']
+        if index.type == 'Number' and index.value.isdigit() and int(index.value) >= size:
+            self.errors.append(index_bounds_message(index.value, name, size))
+
+    def variable_shape(self, identifier: int) -> Optional[Tuple[int]]:
+        """
+        Размер массива или None для скалярной переменной
+        """
+        size = self.symbol_table.get(identifier, {}).get('size')
+        return (size,) if size else None
+
+    def infer_expression_shape(self, node: ASTNode) -> Optional[Tuple[int]]:
+        """
+        Размер значения выражения: None - скаляр, (n,) - массив из n элементов.
+        Операции над массивами выполняются поэлементно, скаляр применяется ко всем элементам
+        """
+        if node.type == 'Identifier':
+            return self.variable_shape(node.value)
+        if node.type == 'Index':
+            self.validate_index(node.value, node.children[0])
+            return None
+        if node.type in ('BinaryOperation', 'Comparison'):
+            left = self.infer_expression_shape(node.children[0])
+            right = self.infer_expression_shape(node.children[1])
+            if left and right and left != right:
+                self.errors.append(size_mismatch_message(node.value['operator'], left[0], right[0]))
+            return left or right
+        return None
+
+    def require_scalar(self, node: ASTNode, context: str):
+        """
+        Проверка, что выражение - не массив
+        """
+        if self.infer_expression_shape(node) is not None:
+            self.errors.append(array_not_allowed_message(context))
 
     def validate_conditional(self, node: ASTNode):
         """
@@ -113,6 +257,7 @@ class SemanticAnalyzer:
         condition = node.children[0]
         if condition.type == 'Comparison':
             self.validate_comparison(condition)
+        self.require_scalar(condition, "Условие")
         
         # Проверка веток then и else
         for branch in node.children[1:]:
@@ -127,7 +272,7 @@ class SemanticAnalyzer:
         right_type = self.infer_expression_type(node.children[1])
         
         if not self.is_numeric_type(left_type) or not self.is_numeric_type(right_type):
-            self.errors.append(f"Сравнение не может быть выполнено для типов {left_type} и {right_type}")
+            self.errors.append(comparison_types_message(left_type, right_type))
 
     def validate_for_loop(self, node: ASTNode):
         """
@@ -140,11 +285,15 @@ class SemanticAnalyzer:
         # Проверка инициализации
         if initialization.type == 'Assignment':
             self.validate_assignment(initialization)
+            counter = initialization.value['identifier']
+            if len(initialization.children) > 1 or self.variable_shape(counter):
+                self.errors.append(counter_message(self.symbols.name(counter)))
         
         # Проверка предела цикла
         limit_type = self.infer_expression_type(limit)
         if not self.is_numeric_type(limit_type):
-            self.errors.append(f"Предел цикла должен быть числом, получен тип {limit_type}")
+            self.errors.append(limit_type_message(limit_type))
+        self.require_scalar(limit, "Предел цикла")
         
         # Проверка тела цикла
         self.validate_statement(body)
@@ -158,7 +307,8 @@ class SemanticAnalyzer:
         
         condition_type = self.infer_expression_type(condition)
         if condition_type != 'bool':
-            self.errors.append(f"Условие цикла должно быть булевым, получен тип {condition_type}")
+            self.errors.append(loop_condition_message(condition_type))
+        self.require_scalar(condition, "Условие цикла")
         
         # Проверка тела цикла
         self.validate_statement(body)
@@ -169,8 +319,8 @@ class SemanticAnalyzer:
         """
         if node.type == 'Number':
             return 'float' if '.' in node.value else 'int'
-        elif node.type == 'Identifier':
-            # Возвращаем тип из таблицы символов
+        elif node.type in ('Identifier', 'Index'):
+            # Возвращаем тип из таблицы символов (для массива - тип элементов)
             return self.symbol_table.get(node.value, {}).get('type')
         elif node.type == 'BooleanConstant':
             return 'bool'
@@ -189,15 +339,10 @@ class SemanticAnalyzer:
         """
         Проверка совместимости типов
         """
-        type_compatibility = {
-            'int': ['int'],
-            'float': ['int', 'float'],
-            'bool': ['bool']
-        }
-        return expr_type in type_compatibility.get(var_type, [])
+        return expr_type in TYPE_COMPATIBILITY.get(var_type, ())
 
     def is_numeric_type(self, type_name: str) -> bool:
         """
         Проверка, является ли тип числовым
         """
-        return type_name in ['int', 'float']
\ No newline at end of file
+        return type_name in NUMERIC_TYPES
\ No newline at end of file
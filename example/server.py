@@ -0,0 +1,208 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple
+from src.pipeline import run_source
+
+REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+# Максимальный размер текста программы в запросе
+MAX_BODY_SIZE = 16 << 20
+
+def _warm_up() -> int:
+    """
+    Пустая задача, заставляющая пул заранее запустить процесс
+    """
+    return os.getpid()
+
+class CompileServer:
+    """
+    Локальный HTTP-сервер: POST /run с текстом программы в теле запроса
+    возвращает токены, ошибки, вывод write() и значения переменных в JSON.
+    Программы выполняются в пуле заранее запущенных процессов
+    """
+    def __init__(self, workers: int = None, max_pending: int = 64,
+                 max_steps: int = None, time_limit: float = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        # Ограничения выполнения: бесконечный цикл не должен занимать процесс пула навсегда
+        self.max_steps = max_steps
+        self.time_limit = time_limit
+        self.pending = 0
+        self.pool = None
+        # Не больше двух задач на процесс в очереди пула, остальные ждут здесь
+        self.slots = asyncio.Semaphore(self.workers * 2)
+
+    def make_pool(self) -> ProcessPoolExecutor:
+        """
+        Процессы пула порождаются через forkserver, запущенный до открытия сокетов:
+        пул, пересозданный во время работы, не наследует открытые соединения клиентов
+        """
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context('forkserver'))
+
+    async def start(self):
+        """
+        Запуск пула процессов
+        """
+        loop = asyncio.get_running_loop()
+        self.pool = self.make_pool()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _warm_up)
+                               for _ in range(self.workers)))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    async def run(self, source: str) -> Tuple[int, dict]:
+        """
+        Выполнение программы в пуле с ограничением числа ожидающих запросов
+        """
+        if self.pending >= self.max_pending:
+            return 503, {'status': 'error', 'errors': ['Сервер перегружен, повторите запрос позже']}
+
+        self.pending += 1
+        try:
+            async with self.slots:
+                loop = asyncio.get_running_loop()
+                pool = self.pool
+                try:
+                    result = await loop.run_in_executor(pool, run_source, source, True,
+                                                        self.max_steps, self.time_limit)
+                except BrokenProcessPool:
+                    # Процесс пула аварийно завершился (например, убит при нехватке памяти):
+                    # сломанный пул больше не принимает задач и заменяется новым
+                    self.restart_pool(pool)
+                    return 500, {'status': 'internal_error',
+                                 'errors': ['Процесс выполнения аварийно завершился, повторите запрос']}
+                except Exception as e:
+                    return 500, {'status': 'internal_error', 'errors': [f"Внутренняя ошибка сервера: {e}"]}
+            return 200, result
+        finally:
+            self.pending -= 1
+
+    def restart_pool(self, broken: ProcessPoolExecutor):
+        """
+        Замена сломанного пула (один раз, даже если сбой заметили несколько запросов)
+        """
+        if self.pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = self.make_pool()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Обработка соединения (с поддержкой keep-alive)
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.respond(writer, 400, {'status': 'error', 'errors': ['Некорректный запрос']}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (version == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                try:
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # Без верной длины тела нельзя найти начало следующего запроса
+                    await self.respond(writer, 400, {'status': 'error', 'errors': ['Некорректный заголовок Content-Length']}, False)
+                    break
+                if length > MAX_BODY_SIZE:
+                    await self.respond(writer, 413, {'status': 'error', 'errors': ['Слишком большой текст программы']}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                if method == 'POST' and target == '/run':
+                    try:
+                        source = body.decode('utf-8')
+                    except UnicodeDecodeError:
+                        status, payload = 400, {'status': 'error', 'errors': ['Текст программы не в кодировке UTF-8']}
+                    else:
+                        status, payload = await self.run(source)
+                elif method == 'GET' and target == '/health':
+                    status, payload = 200, {'status': 'ok', 'pending': self.pending}
+                else:
+                    status, payload = 404, {'status': 'error', 'errors': [f'Неизвестный адрес {target}']}
+
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+async def serve(host: str, port: int, unix_path: str = None, workers: int = None, max_pending: int = 64,
+                max_steps: int = None, time_limit: float = None):
+    """
+    Запуск сервера на localhost или Unix-сокете
+    """
+    server = CompileServer(workers, max_pending, max_steps, time_limit)
+    await server.start()
+    try:
+        if unix_path:
+            listener = await asyncio.start_unix_server(server.handle, path=unix_path)
+            print(f"Сервер запущен: {unix_path}")
+        else:
+            listener = await asyncio.start_server(server.handle, host, port)
+            print(f"Сервер запущен: http://{host}:{port}")
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+def main():
+    arguments = argparse.ArgumentParser(description='Сервис анализа и выполнения программ на модельном языке')
+    arguments.add_argument('--host', default='127.0.0.1')
+    arguments.add_argument('--port', type=int, default=8765)
+    arguments.add_argument('--unix', help='путь к Unix-сокету вместо TCP')
+    arguments.add_argument('--workers', type=int, help='число процессов (по умолчанию - число ядер)')
+    arguments.add_argument('--max-pending', type=int, default=64, help='максимум ожидающих запросов')
+    arguments.add_argument('--max-steps', type=int, help='максимум итераций циклов в одной программе')
+    arguments.add_argument('--time-limit', type=float, default=10.0, help='время выполнения одной программы, с')
+    options = arguments.parse_args()
+
+    try:
+        asyncio.run(serve(options.host, options.port, options.unix, options.workers, options.max_pending,
+                          options.max_steps, options.time_limit))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, List, TextIO
+from src.runtime_io import format_line
+
+class OutputSink(ABC):
+    """
+    Приёмник вывода операторов write() и writeln
+    """
+    @abstractmethod
+    def write(self, value: Any):
+        """
+        Значение оператора write()
+        """
+
+    def write_line(self, values: List[Any]):
+        """
+        Строка writeln: значения через пробел; по умолчанию передаётся
+        в write() одним значением - текстом без перевода строки
+        """
+        self.write(format_line(values)[:-1])
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+class StreamSink(OutputSink):
+    """
+    Буферизованный вывод в поток (по умолчанию - в стандартный вывод).
+    Значения накапливаются и форматируются пачкой при сбросе буфера;
+    flush_every - число значений, после которого буфер сбрасывается
+    (1 - печатать каждое значение сразу, как print).
+    Строки writeln форматируются сразу (массив может измениться позже);
+    накопленные к этому моменту значения write() переводятся в текст перед ними
+    """
+    def __init__(self, stream: TextIO = None, flush_every: int = 4096,
+                 template: str = 'WRITE: {}\n'):
+        self.stream = stream
+        self.flush_every = flush_every
+        self.format = template.format
+        self.pending: List[Any] = []
+        self.lines: List[str] = []  # готовый текст, выводится раньше pending
+
+    def write(self, value: Any):
+        pending = self.pending
+        pending.append(value)
+        if len(pending) >= self.flush_every:
+            self.flush()
+
+    def write_line(self, values: List[Any]):
+        if self.pending:
+            self.lines.append(''.join(map(self.format, self.pending)))
+            self.pending.clear()
+        self.lines.append(format_line(values))
+        if len(self.lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        stream = self.stream or sys.stdout
+        if self.lines:
+            stream.write(''.join(self.lines))
+            self.lines.clear()
+        if self.pending:
+            stream.write(''.join(map(self.format, self.pending)))
+            self.pending.clear()
+        stream.flush()
+
+class FileSink(StreamSink):
+    """
+    Буферизованный вывод в файл
+    """
+    def __init__(self, path: str, flush_every: int = 65536,
+                 buffer_size: int = 1 << 20, template: str = 'WRITE: {}\n'):
+        super().__init__(open(path, 'w', buffering=buffer_size, encoding='utf-8'),
+                         flush_every, template)
+
+    def close(self):
+        self.flush()
+        self.stream.close()
+
+class MemorySink(OutputSink):
+    """
+    Сохранение выведенных значений в список (для тестов и пакетного запуска)
+    """
+    def __init__(self):
+        self.values: List[Any] = []
+        # Намеренный быстрый путь: write экземпляра - сам list.append,
+        # без промежуточного вызова метода на каждое значение write()
+        self.write = self.values.append
+
+    def write(self, value: Any):
+        """
+        Нужен только для OutputSink (абстрактный метод): у экземпляров
+        его заменяет self.values.append из __init__
+        """
+        self.values.append(value)
+
+class NullSink(OutputSink):
+    """
+    Отбрасывание вывода (для замеров производительности)
+    """
+    def write(self, value: Any):
+        pass
+
+    def write_line(self, values: List[Any]):
+        pass
@@ -0,0 +1,44 @@
+from typing import Dict, List, Iterable
+
+# Ключевые слова модельного языка. Они интернируются первыми,
+# поэтому проверка "является ли слово ключевым" сводится к сравнению номера.
+KEYWORDS = (
+    'program', 'var', 'begin', 'end', 'end.', 'int', 'float', 'bool',
+    'if', 'then', 'else', 'for', 'to', 'do', 'while',
+    'true', 'false', 'write', 'readln', 'writeln'
+)
+
+class SymbolTable:
+    """
+    Общая таблица имён: каждому ключевому слову и идентификатору
+    сопоставляется небольшой целый номер
+    """
+    def __init__(self, keywords: Iterable[str] = KEYWORDS):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        for keyword in keywords:
+            self.intern(keyword)
+        self.keyword_count = len(self.names)
+
+    def intern(self, name: str) -> int:
+        """
+        Получение номера имени (с добавлением в таблицу, если его ещё нет)
+        """
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = len(self.names)
+            self.ids[name] = symbol
+            self.names.append(name)
+        return symbol
+
+    def is_keyword(self, symbol: int) -> bool:
+        """
+        Проверка, является ли номер номером ключевого слова
+        """
+        return 0 <= symbol < self.keyword_count
+
+    def name(self, symbol: int) -> str:
+        """
+        Имя по номеру (для сообщений об ошибках и вывода)
+        """
+        return self.names[symbol]
@@ -0,0 +1,283 @@
+import argparse
+import json
+import math
+import struct
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from src.interpreter import Interpreter
+from src.parser import ASTNode
+from src.symbols import SymbolTable
+
+# Событие в файле (16 байт): вид события и номер оператора (kind | statement << 8),
+# номер переменной, значение. Номер оператора занимает 24 бита
+EVENT = struct.Struct('<IId')
+EVENT_SIZE = EVENT.size
+
+# Виды событий
+STATEMENT = 1  # выполнение оператора (кроме присваивания и readln)
+ASSIGN_INT = 2  # присваивание: оператор, переменная и новое значение
+ASSIGN_FLOAT = 3
+ASSIGN_BOOL = 4
+ASSIGN_NONE = 5
+ASSIGN_ARRAY = 6  # присваивание массиву целиком; значение - скаляр заполнения или nan
+ELEMENT = 7  # индекс элемента массива для следующего события присваивания
+
+VALUE_KINDS = {float: ASSIGN_FLOAT, int: ASSIGN_INT, bool: ASSIGN_BOOL, type(None): ASSIGN_NONE}
+
+# Заголовок файла: сигнатура, ёмкость буфера, длина метаданных, всего событий записано.
+# Событие присваивания элементу массива занимает в файле две записи (ELEMENT и значение)
+HEADER = struct.Struct('<4sIIQ')
+MAGIC = b'TRC3'
+
+# Операторы, получающие номера в трассе
+TRACED_STATEMENTS = ('Assignment', 'ConditionalStatement', 'ForLoop', 'WhileLoop', 'WriteStatement',
+                     'ReadStatement', 'WriteLineStatement')
+
+class TraceBuffer:
+    """
+    Кольцевой буфер трассы выполнения: хранит последние capacity событий
+    (выполненные операторы и присвоенные значения).
+    Во время выполнения событие - только ссылки на узел оператора, переменную
+    и значение в заранее выделенных списках; номера операторов, виды значений
+    и двоичный вид событий получаются при сохранении (raw_events).
+    Если задан error_path, TracingInterpreter сохраняет трассу в этот файл при ошибке
+    """
+    def __init__(self, capacity: int = 1 << 16, error_path: Optional[str] = None):
+        self.capacity = capacity
+        self.error_path = error_path
+        # Кольцо событий: узел оператора, переменная (None - выполнение оператора),
+        # значение и индекс элемента массива
+        self.nodes: List[Optional[ASTNode]] = [None] * capacity
+        self.variables: List[Optional[int]] = [None] * capacity
+        self.values: List[Any] = [None] * capacity
+        self.positions: List[Optional[int]] = [None] * capacity
+        self.ids: Dict[ASTNode, int] = {}  # узел -> номер оператора, сдвинутый на 8 бит
+        self.statements: List[Tuple[str, int, int]] = []  # номер -> (тип, строка, позиция)
+        self.names: Dict[int, str] = {}
+        self.arrays: Set[int] = set()
+        self.source: Optional[str] = None
+        self.make_recorders()
+
+    def bind(self, ast: ASTNode, symbols: SymbolTable, source: Optional[str] = None):
+        """
+        Нумерация операторов программы и запоминание имён переменных
+        """
+        self.ids.clear()
+        self.statements.clear()
+        self.source = source
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if node.type in TRACED_STATEMENTS:
+                self.ids[node] = len(self.statements) << 8
+                self.statements.append((node.type, node.value.get('line'), node.value.get('column')))
+            elif node.type == 'VariableDeclarations':
+                for decl in node.children:
+                    identifier = decl.value['identifier']
+                    self.names[identifier] = symbols.name(identifier)
+                    if decl.value.get('size'):
+                        self.arrays.add(identifier)
+            stack.extend(reversed(node.children))
+
+    def make_recorders(self):
+        """
+        Создание методов записи statement и assign (сигнатуры - как у Interpreter.on_statement
+        и Interpreter.on_assign). Замыкания над локальными переменными: на событие
+        приходится два-четыре присваивания элементам списков без обращений к атрибутам
+        """
+        nodes, variables, values, positions = self.nodes, self.variables, self.values, self.positions
+        capacity = self.capacity
+        slot = 0  # место следующего события
+        laps = 0  # сколько раз кольцо заполнялось целиком
+
+        def statement(node: ASTNode):
+            nonlocal slot, laps
+            nodes[slot] = node
+            variables[slot] = None
+            slot += 1
+            if slot == capacity:
+                slot, laps = 0, laps + 1
+
+        def assign(node: ASTNode, variable: int, value: Any, position: Optional[int] = None):
+            nonlocal slot, laps
+            nodes[slot] = node
+            variables[slot] = variable
+            values[slot] = value
+            positions[slot] = position
+            slot += 1
+            if slot == capacity:
+                slot, laps = 0, laps + 1
+
+        def position() -> Tuple[int, int]:
+            return slot, laps
+
+        self.statement = statement
+        self.assign = assign
+        self.position = position
+
+    @property
+    def count(self) -> int:
+        """
+        Всего записано событий
+        """
+        slot, laps = self.position()
+        return laps * self.capacity + slot
+
+    def raw_events(self) -> bytes:
+        """
+        События буфера в порядке записи в двоичном виде (EVENT).
+        Присваивание массиву целиком сохраняет только скаляр заполнения (nan - массив),
+        None записывается как 0.0
+        """
+        slot, laps = self.position()
+        order = list(range(slot, self.capacity)) + list(range(slot)) if laps else range(slot)
+        ids, arrays, kinds, pack = self.ids, self.arrays, VALUE_KINDS, EVENT.pack
+        events = bytearray()
+        for index in order:
+            head = ids[self.nodes[index]]
+            variable = self.variables[index]
+            if variable is None:
+                events += pack(STATEMENT | head, 0, 0.0)
+                continue
+            value, position = self.values[index], self.positions[index]
+            if position is not None:
+                events += pack(ELEMENT | head, variable, float(position))
+            elif variable in arrays:
+                events += pack(ASSIGN_ARRAY | head, variable,
+                               math.nan if hasattr(value, 'shape') else float(value))
+                continue
+            events += pack(kinds.get(value.__class__, ASSIGN_FLOAT) | head, variable, value or 0.0)
+        return bytes(events)
+
+    def dump(self, path: str):
+        """
+        Сохранение трассы в файл
+        """
+        meta = json.dumps({
+            'statements': self.statements,
+            'names': {str(identifier): name for identifier, name in self.names.items()},
+            'source': self.source,
+        }, ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, self.capacity, len(meta), self.count))
+            file.write(meta)
+            file.write(self.raw_events())
+
+class TracingInterpreter(Interpreter):
+    """
+    Интерпретатор, записывающий выполнение в TraceBuffer: точки наблюдения
+    on_statement и on_assign заменяются методами записи буфера
+    """
+    def __init__(self, symbol_table: Dict[int, Dict], symbols: SymbolTable,
+                 trace: Optional[TraceBuffer] = None, **options):
+        super().__init__(symbol_table, symbols, **options)
+        self.trace = trace if trace is not None else TraceBuffer()
+        # Замыкания буфера вызываются из операторов напрямую, без промежуточного метода
+        self.on_statement = self.trace.statement
+        self.on_assign = self.trace.assign
+
+    def interpret(self, ast: ASTNode):
+        if not self.trace.statements:
+            self.trace.bind(ast, self.symbols)
+        try:
+            super().interpret(ast)
+        except Exception:
+            if self.trace.error_path:
+                self.trace.dump(self.trace.error_path)
+            raise
+
+class TraceFile(NamedTuple):
+    """
+    Прочитанный файл трассы
+    """
+    capacity: int
+    total: int  # всего событий записано за время выполнения
+    statements: List[Tuple[str, int, int]]
+    names: Dict[int, str]
+    source: Optional[str]
+    events: List[Tuple[int, int, float]]  # последние события (вид, номер, значение)
+
+def read_trace(path: str) -> TraceFile:
+    with open(path, 'rb') as file:
+        data = file.read()
+    magic, capacity, meta_length, total = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} не является файлом трассы")
+    meta = json.loads(data[HEADER.size:HEADER.size + meta_length].decode('utf-8'))
+    events = list(EVENT.iter_unpack(data[HEADER.size + meta_length:]))
+    names = {int(identifier): name for identifier, name in meta['names'].items()}
+    return TraceFile(capacity, total, [tuple(statement) for statement in meta['statements']],
+                     names, meta['source'], events)
+
+def format_value(kind: int, value: float) -> str:
+    if kind == ASSIGN_INT:
+        return str(int(value))
+    if kind == ASSIGN_BOOL:
+        return 'true' if value else 'false'
+    if kind == ASSIGN_NONE:
+        return 'не задано'
+    if kind == ASSIGN_ARRAY:
+        return '<массив>' if math.isnan(value) else f"{value} (все элементы)"
+    return repr(value)
+
+def format_trace(trace: TraceFile, source_lines: Optional[List[str]] = None,
+                 last: Optional[int] = None) -> List[str]:
+    """
+    Пошаговая история: выполненные операторы со строками исходного текста
+    и присвоенные ими значения
+    """
+    if source_lines is None and trace.source is not None:
+        source_lines = trace.source.split('\n')
+    events = trace.events
+    shown = sum(1 for head, _, _ in events if head & 0xFF != ELEMENT)
+    if last and last < shown:
+        # Отбрасываем события с начала, не отделяя запись ELEMENT от её присваивания
+        skip = shown - last
+        start = 0
+        while skip:
+            if events[start][0] & 0xFF != ELEMENT:
+                skip -= 1
+            start += 1
+        events, shown = events[start:], last
+    number = trace.total - shown  # номер первого показываемого события
+
+    lines = [f"Событий записано: {trace.total}, показано: {shown}"]
+    index = None
+    for head, identifier, value in events:
+        kind, statement = head & 0xFF, head >> 8
+        statement_type, line, column = trace.statements[statement]
+        if kind == ELEMENT:
+            index = int(value)
+            continue
+        number += 1
+
+        if kind == STATEMENT:
+            action = statement_type
+        else:
+            name = trace.names.get(identifier, f"#{identifier}")
+            target = f"{name}[{index}]" if index is not None else name
+            action = f"{target} = {format_value(kind, value)}"
+            index = None
+        text = ''
+        if source_lines and line is not None and 0 < line <= len(source_lines):
+            text = source_lines[line - 1].strip()
+        lines.append(f"{number:>10}  строка {line:<5} {action:<30} | {text}")
+    return lines
+
+def main():
+    arguments = argparse.ArgumentParser(description='Просмотр трассы выполнения программы')
+    arguments.add_argument('path', help='файл трассы')
+    arguments.add_argument('--source', help='файл с текстом программы, если текст не сохранён в трассе')
+    arguments.add_argument('--last', type=int, help='показать только последние N событий')
+    options = arguments.parse_args()
+
+    source_lines = None
+    if options.source:
+        with open(options.source, encoding='utf-8') as file:
+            source_lines = file.read().split('\n')
+    for line in format_trace(read_trace(options.path), source_lines, options.last):
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,561 @@
+import argparse
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from src.lexer import LexicalAnalyzer, Token
+from src.ll1 import ParseTable, load_table
+from src.semantic_analyzer import (
+    ALLOWED_TYPES, NUMERIC_TYPES, TYPE_COMPATIBILITY, array_not_allowed_message, comparison_types_message,
+    counter_message, incompatible_sizes_message, incompatible_types_message, index_bounds_message,
+    index_type_message, limit_type_message, loop_condition_message, output_type_message, redeclared_message,
+    size_mismatch_message, undeclared_message)
+from src.symbols import KEYWORDS
+
+def multi_char_ops() -> List[str]:
+    """
+    Многосимвольные операторы LexicalAnalyzer, длинные первыми
+    """
+    lexer = LexicalAnalyzer()
+    return sorted(lexer.relation_ops | lexer.addition_ops | lexer.multiplication_ops | {'as'},
+                  key=len, reverse=True)
+
+# Слова текста в том же порядке проверок, что у LexicalAnalyzer (только для текста в ASCII):
+# комментарий, end., многосимвольные операторы (без границы слова: asd - это as и d),
+# идентификатор, число, простой оператор; \S - символ, с которого не начинается ни один токен
+MULTI_CHAR_OPS = multi_char_ops()
+SIMPLE_OPS = '+-*/():;[],'
+WORD = re.compile(r"\{[^}\n]*\}|end\.|" + '|'.join(MULTI_CHAR_OPS) +
+                  r"|[A-Za-z][A-Za-z0-9]*|[0-9]+(?:\.[0-9]*)?|\.[0-9]+|\S")
+
+# Виды слов, которых нет среди видов токенов
+COMMENT = -1
+INVALID = -2
+
+# Атрибуты выражений при проверке без AST: (тип, размер массива или None для скаляра,
+# номер слова - числа, имени переменной или имени массива у элемента; у операций None).
+# Как в SemanticAnalyzer, тип необъявленной переменной - None, ошибочной операции - 'unknown'
+SCALARS = {var_type: (var_type, None, None) for var_type in ('int', 'float', 'bool', 'unknown')}
+# Запись таблицы символов (тип, размер) для необъявленной переменной
+UNDECLARED = (None, None)
+
+class Problem(NamedTuple):
+    """
+    Ошибка в проверяемом тексте: этап ('lexical', 'syntax', 'semantic'),
+    место (строки с 1, позиции с 0; None - конец текста) и сообщение
+    """
+    stage: str
+    line: Optional[int]
+    column: Optional[int]
+    message: str
+
+    def describe(self) -> str:
+        if self.line is None:
+            return self.message
+        return f"{self.line}:{self.column}: {self.message}"
+
+class Rejected(Exception):
+    """
+    Синтаксическая ошибка распознавания; position - номер токена
+    """
+    def __init__(self, message: str, position: int):
+        super().__init__(message)
+        self.message = message
+        self.position = position
+
+class WordKinds(dict):
+    """
+    Виды слов текста: ключевые слова и операторы заполнены заранее,
+    остальные слова классифицируются при первой встрече
+    """
+    def __init__(self, table: ParseTable):
+        super().__init__(base_kinds(table))
+        self.identifier_kind = table.identifier_kind
+        self.number_kind = table.number_kind
+
+    def __missing__(self, word: str) -> int:
+        first = word[0]
+        if first.isalpha():
+            kind = self.identifier_kind
+        elif first.isdigit() or (first == '.' and len(word) > 1):
+            kind = self.number_kind
+        elif first == '{' and len(word) > 1:
+            kind = COMMENT
+        else:
+            kind = INVALID
+        self[word] = kind
+        return kind
+
+@lru_cache(maxsize=8)
+def base_kinds(table: ParseTable) -> Dict[str, int]:
+    literal, unknown = table.literal_kinds, table.unknown_kind
+    return {word: literal.get(word, unknown) for word in (*KEYWORDS, *MULTI_CHAR_OPS, *SIMPLE_OPS)}
+
+@lru_cache(maxsize=8)
+def recognizer_bodies(table: ParseTable, kept: Tuple[bool, ...]) -> List[Tuple[int, ...]]:
+    """
+    Правые части альтернатив без действий, для которых у распознавателя нет проверки
+    """
+    action_base = table.action_base
+    return [tuple(symbol for symbol in body if symbol < action_base or kept[symbol - action_base])
+            for body in table.bodies]
+
+class Recognizer:
+    """
+    Проверка текста без построения AST: разбор по той же LL(1)-таблице, что у TableParser,
+    но из действий грамматики выполняются только те, для которых есть метод check_<имя>.
+    Recognizer проверяет лексику и синтаксис; таблица символов ведётся только
+    для предиката ?array, а на стеке значений - только номера слов (@push) и размеры
+    массивов. Токены не создаются: текст в ASCII делится на слова
+    одним регулярным выражением, место в тексте вычисляется только для ошибок
+    """
+    def __init__(self, code: str, table: ParseTable = None):
+        self.code = code
+        self.table = table or load_table()
+        self.tokens: Optional[List[Token]] = None  # токены LexicalAnalyzer для текста не в ASCII
+        self.words: List[str] = []
+        self.kinds: List[int] = []
+        self.symbol_table: Dict[str, Tuple[str, Optional[int]]] = {}
+        self.values: List = []
+        self.errors: List[Tuple[int, str]] = []  # семантические ошибки: (номер токена, сообщение)
+        self.checks = [getattr(self, 'check_' + name, None) for name in self.table.grammar.actions]
+        self.predicates = [getattr(self, 'predicate_' + name) for name in self.table.grammar.predicates]
+
+    def validate(self) -> List[Problem]:
+        """
+        Ошибки текста: первая лексическая или синтаксическая ошибка либо все семантические
+        """
+        problem = self.scan()
+        if problem is not None:
+            return [problem]
+        try:
+            self.recognize()
+        except Rejected as e:
+            if e.position >= len(self.words):
+                return [Problem('syntax', None, None, "Неожиданный конец токенов")]
+            line, column = self.locate([e.position])[e.position]
+            return [Problem('syntax', line, column, e.message)]
+
+        errors = sorted(self.errors, key=lambda error: error[0])
+        places = self.locate([position for position, _ in errors])
+        return [Problem('semantic', *places[position], message) for position, message in errors]
+
+    def scan(self) -> Optional[Problem]:
+        """
+        Деление текста на слова и виды токенов; результат - лексическая ошибка или None
+        """
+        code = self.code
+        if not code.isascii():
+            return self.scan_tokens()
+
+        words = WORD.findall(code)
+        kinds = list(map(WordKinds(self.table).__getitem__, words))
+        if kinds and min(kinds) < 0:
+            if INVALID in kinds:
+                return self.lexical_error(kinds.index(INVALID))
+            pairs = [(word, kind) for word, kind in zip(words, kinds) if kind != COMMENT]
+            words = [word for word, _ in pairs]
+            kinds = [kind for _, kind in pairs]
+        kinds.append(self.table.end_kind)
+        self.words, self.kinds = words, kinds
+        return None
+
+    def scan_tokens(self) -> Optional[Problem]:
+        """
+        Текст не в ASCII делится на токены LexicalAnalyzer: буквы и цифры в нём
+        определяются по Unicode
+        """
+        try:
+            self.tokens = LexicalAnalyzer().tokenize(self.code)
+        except SyntaxError as e:
+            return Problem('lexical', None, None, str(e))
+        self.words = [token.value for token in self.tokens]
+        self.kinds = self.table.token_kinds(self.tokens)
+        return None
+
+    def lexical_error(self, index: int) -> Problem:
+        """
+        Ошибка в слове номер index (считая комментарии)
+        """
+        match = next(match for number, match in enumerate(WORD.finditer(self.code)) if number == index)
+        line, column = self.place(match.start())
+        if match.group() == '{':
+            return Problem('lexical', line, column, "Незакрытый комментарий")
+        return Problem('lexical', line, column, f"Неизвестный символ: {match.group()}")
+
+    def place(self, offset: int) -> Tuple[int, int]:
+        line_start = self.code.rfind('\n', 0, offset) + 1
+        return self.code.count('\n', 0, offset) + 1, offset - line_start
+
+    def locate(self, positions: Iterable[int]) -> Dict[int, Tuple[Optional[int], Optional[int]]]:
+        """
+        Строка и позиция токенов с данными номерами (None - конец текста)
+        за один проход по тексту
+        """
+        wanted = sorted(set(positions))
+        places = {position: (None, None) for position in wanted}
+        if self.tokens is not None:
+            for position in wanted:
+                if position < len(self.tokens):
+                    places[position] = (self.tokens[position].line, self.tokens[position].column)
+            return places
+
+        pending = iter(wanted)
+        target = next(pending, None)
+        index = 0
+        for match in WORD.finditer(self.code):
+            if target is None or target >= len(self.words):
+                break
+            word = match.group()
+            if word[0] == '{' and len(word) > 1:
+                continue
+            if index == target:
+                places[target] = self.place(match.start())
+                target = next(pending, None)
+            index += 1
+        return places
+
+    def recognize(self):
+        table = self.table
+        kinds = self.kinds
+        cells, kind_count, action_base = table.cells, table.kind_count, table.action_base
+        checks = self.checks
+        bodies = recognizer_bodies(table, tuple(check is not None for check in checks))
+
+        stack = [table.start]
+        position = 0
+        kind = kinds[0]
+        while stack:
+            symbol = stack.pop()
+            if symbol < kind_count:
+                if symbol != kind:
+                    raise self.mismatch(symbol, position)
+                position += 1
+                kind = kinds[position]
+            elif symbol < action_base:
+                production = cells[symbol * kind_count + kind]
+                if production < 0:
+                    production = self.choose(symbol, production, position)
+                stack.extend(bodies[production])
+            else:
+                checks[symbol - action_base](position)
+
+    def choose(self, nonterminal: int, cell: int, position: int) -> int:
+        """
+        Выбор альтернативы в клетке с предикатами; сообщение об ошибке - как у TableParser
+        """
+        if cell != -1:
+            for predicate, production in self.table.choices[-2 - cell]:
+                if predicate < 0 or self.predicates[predicate](position):
+                    if production >= 0:
+                        return production
+                    break
+        rejected = self.table.terminal_names[self.kinds[position]]
+        expected = ', '.join(name for name in self.table.expected(nonterminal) if name != rejected)
+        raise Rejected(f"Неожиданный токен: {self.word(position)}; ожидалось: {expected}", position)
+
+    def mismatch(self, kind: int, position: int) -> Rejected:
+        return Rejected(f"Ожидалось значение {self.table.terminal_names[kind]}, "
+                        f"получено '{self.word(position)}'", position)
+
+    def word(self, position: int) -> str:
+        return self.words[position] if position < len(self.words) else ''
+
+    def declare(self, identifier: int, var_type: str, size: Optional[int]):
+        self.symbol_table[self.words[identifier]] = (var_type, size)
+
+    # Предикаты и проверки: position - номер текущего токена, разобранный последним - position - 1
+
+    def predicate_array(self, position: int) -> bool:
+        entry = self.symbol_table.get(self.words[position - 1])
+        return entry is not None and entry[1] is not None
+
+    # Значения операторов распознавателю не нужны: номера слов, положенные @push и @none
+    # в операторах, остаются на стеке (их не больше, чем слов в тексте)
+
+    def check_push(self, position: int):
+        self.values.append(position - 1)
+
+    def check_none(self, position: int):
+        self.values.append(None)
+
+    def check_size(self, position: int):
+        size = self.words[position - 1]
+        if not size.isdigit() or int(size) == 0:
+            raise Rejected(f"Размер массива должен быть положительным целым числом, получено {size}",
+                           position - 1)
+        self.values.append(int(size))
+
+    def check_declaration(self, position: int):
+        values = self.values
+        size = values.pop()
+        var_type = values.pop()
+        identifier = values.pop()
+        self.declare(identifier, self.words[var_type], size)
+
+class Validator(Recognizer):
+    """
+    Recognizer с семантическими проверками SemanticAnalyzer. Действия грамматики
+    кладут на стек значений вместо узлов AST атрибуты (тип, размер) выражений,
+    и каждое правило проверяется, как только разобрана его конструкция.
+    Место ошибки - начало оператора, имя массива при ошибке индекса
+    или знак операции при несовпадении размеров
+    """
+    def error(self, position: int, message: str):
+        self.errors.append((position, message))
+
+    def declare(self, identifier: int, var_type: str, size: Optional[int]):
+        name = self.words[identifier]
+        if name in self.symbol_table:
+            self.error(identifier, redeclared_message(name))
+        super().declare(identifier, var_type, size)
+
+    def check_subscript(self, size: int, index: Tuple, identifier: int):
+        """
+        Проверка индекса элемента массива из size элементов, как в SemanticAnalyzer.validate_index;
+        identifier - номер имени массива
+        """
+        index_type, index_size, word = index
+        literal = self.words[word] if word is not None else ''
+        out_of_bounds = literal.isdigit() and int(literal) >= size
+        if index_type == 'int' and index_size is None and not out_of_bounds:
+            return
+        name = self.words[identifier]
+        if index_type != 'int':
+            self.error(identifier, index_type_message(name, index_type))
+        if index_size is not None:
+            self.error(identifier, array_not_allowed_message(f"Индекс массива {name}"))
+        if out_of_bounds:
+            self.error(identifier, index_bounds_message(literal, name, size))
+
+    def combine(self, left: Tuple, right: Tuple, operator: int, result_type: str) -> Tuple:
+        """
+        Размер результата поэлементной операции; разные размеры массивов - ошибка
+        """
+        left_size, right_size = left[1], right[1]
+        if left_size and right_size and left_size != right_size:
+            self.error(operator, size_mismatch_message(self.words[operator], left_size, right_size))
+        size = left_size or right_size
+        return SCALARS[result_type] if size is None else (result_type, size, None)
+
+    # Действия построения списков и значений - с тем же числом значений на стеке, что у TableParser
+
+    def check_mark(self, position: int):
+        self.values.append(position)
+
+    def check_list(self, position: int):
+        self.values.append([])
+
+    def check_append(self, position: int):
+        item = self.values.pop()
+        self.values[-1].append(item)
+
+    def check_declaration(self, position: int):
+        super().check_declaration(position)
+        self.values.append(None)
+
+    # Операторы: значение оператора на стеке - None, у присваивания - номер имени
+    # переменной и признак присваивания элементу массива
+
+    def check_assignment(self, position: int):
+        values, words = self.values, self.words
+        expression = values.pop()
+        index = values.pop()
+        start = values[-1]
+        values[-1] = (start, index is not None)
+        name = words[start]
+        entry = self.symbol_table.get(name)
+        if entry is None:
+            # Как в SemanticAnalyzer: выражение при необъявленной переменной не проверяется
+            errors = self.errors
+            while errors and errors[-1][0] > start:
+                errors.pop()
+            self.error(start, undeclared_message(name))
+            return
+
+        var_type, size = entry
+        expression_type, expression_size, _ = expression
+        if expression_type not in TYPE_COMPATIBILITY.get(var_type, ()):
+            self.error(start, incompatible_types_message(name, var_type, expression_type))
+        if index is not None:
+            self.check_subscript(size, index, start)
+            size = None
+        if expression_size is not None and expression_size != size:
+            self.error(start, incompatible_sizes_message(name, index is not None, size, expression_size))
+
+    def check_write(self, position: int):
+        values = self.values
+        expression_type, expression_size, _ = values.pop()
+        start = values[-1]
+        values[-1] = None
+        if expression_size is not None:
+            self.error(start, array_not_allowed_message("Аргумент write()"))
+        if expression_type not in ALLOWED_TYPES:
+            self.error(start, output_type_message('write()', expression_type))
+
+    def check_read(self, position: int):
+        values = self.values
+        targets = values.pop()
+        values[-1] = None
+        # Цель readln - имя переменной или элемент массива; номер имени - в атрибутах цели
+        for target_type, _, identifier in targets:
+            if target_type is None:
+                self.error(identifier, undeclared_message(self.words[identifier]))
+
+    def check_writeln(self, position: int):
+        values = self.values
+        arguments = values.pop()
+        start = values[-1]
+        values[-1] = None
+        for expression_type, _, _ in arguments:
+            if expression_type not in ALLOWED_TYPES:
+                self.error(start, output_type_message('writeln', expression_type))
+
+    def check_conditional(self, position: int):
+        values = self.values
+        del values[-2:]
+        condition = values.pop()
+        if condition[1] is not None:
+            self.error(values[-1], array_not_allowed_message("Условие"))
+        values[-1] = None
+
+    def check_for(self, position: int):
+        values, words = self.values, self.words
+        values.pop()
+        limit_type, limit_size, _ = values.pop()
+        counter, element = values.pop()
+        start = values[-1]
+        values[-1] = None
+        entry = self.symbol_table.get(words[counter])
+        if entry is not None and (element or entry[1]):
+            self.error(counter, counter_message(words[counter]))
+        if limit_type not in NUMERIC_TYPES:
+            self.error(start, limit_type_message(limit_type))
+        if limit_size is not None:
+            self.error(start, array_not_allowed_message("Предел цикла"))
+
+    def check_while(self, position: int):
+        values = self.values
+        values.pop()
+        condition_type, condition_size, _ = values.pop()
+        start = values[-1]
+        values[-1] = None
+        if condition_type != 'bool':
+            self.error(start, loop_condition_message(condition_type))
+        if condition_size is not None:
+            self.error(start, array_not_allowed_message("Условие цикла"))
+
+    # Выражения: значение на стеке - атрибуты (тип, размер, номер слова)
+
+    def check_comparison(self, position: int):
+        values = self.values
+        right = values.pop()
+        operator = values.pop()
+        left = values[-1]
+        if left[0] not in NUMERIC_TYPES or right[0] not in NUMERIC_TYPES:
+            self.error(operator, comparison_types_message(left[0], right[0]))
+        values[-1] = self.combine(left, right, operator, 'bool')
+
+    def check_binary(self, position: int):
+        values = self.values
+        right = values.pop()
+        operator = values.pop()
+        left = values[-1]
+        if left[0] in NUMERIC_TYPES and right[0] in NUMERIC_TYPES:
+            result_type = 'float' if 'float' in (left[0], right[0]) else 'int'
+        else:
+            result_type = 'unknown'
+        values[-1] = self.combine(left, right, operator, result_type)
+
+    def check_boolean(self, position: int):
+        self.values.append(SCALARS['bool'])
+
+    def check_number(self, position: int):
+        self.values.append(('float' if '.' in self.words[position - 1] else 'int', None, position - 1))
+
+    def check_identifier(self, position: int):
+        var_type, size = self.symbol_table.get(self.words[position - 1], UNDECLARED)
+        self.values.append((var_type, size, position - 1))
+
+    def check_index(self, position: int):
+        values = self.values
+        index = values.pop()
+        var_type, size, identifier = values[-1]
+        # Номер имени остаётся в атрибутах элемента: он нужен целям readln
+        values[-1] = (var_type, None, identifier)
+        self.check_subscript(size, index, identifier)
+
+def validate_source(code: str, semantic: bool = True, table: ParseTable = None) -> List[Problem]:
+    """
+    Ошибки текста программы без построения AST (пустой список - текст корректен);
+    semantic=False - только лексика и синтаксис
+    """
+    return (Validator if semantic else Recognizer)(code, table).validate()
+
+def validate_files(paths: Iterable[str], semantic: bool = True) -> Iterator[Tuple[str, List[Problem]]]:
+    """
+    Проверка файлов по одному; нечитаемый файл - одна ошибка этапа 'file'
+    """
+    table = load_table()
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as file:
+                code = file.read()
+        except (OSError, UnicodeDecodeError) as e:
+            yield path, [Problem('file', None, None, str(e))]
+            continue
+        yield path, validate_source(code, semantic, table)
+
+def main():
+    from src.pipeline import compile_source
+
+    arguments = argparse.ArgumentParser(description='Проверка программ без построения AST')
+    arguments.add_argument('files', nargs='*', help='проверяемые файлы (без файлов - замер на примере)')
+    arguments.add_argument('--syntax', action='store_true', help='только лексика и синтаксис')
+    options = arguments.parse_args()
+
+    if options.files:
+        invalid = 0
+        for path, problems in validate_files(options.files, not options.syntax):
+            invalid += bool(problems)
+            if not problems:
+                print(f"{path}: ошибок нет")
+            for problem in problems:
+                print(f"{path}:{problem.describe()}" if problem.line is not None else f"{path}: {problem.message}")
+        print(f"Файлов: {len(options.files)}, с ошибками: {invalid}")
+        raise SystemExit(1 if invalid else 0)
+
+    statements = ['A as 10',
+                  'for I as 1 to 99 do [V[I] as I mult 2; if V[I] GT 50 then B as B plus V[I] else B as B min 1]',
+                  'if A GT 0 then A as A min 1 else [A as 0; B as 1]',
+                  'while C do [readln(X, W); writeln(X, V); C as false]',
+                  'W as V mult 0.5; write(B)']
+    sample_code = ('program var A int; B float; X float; C bool; I int; V float[100]; W float[100]; U float[10];\nbegin\n'
+                   + ';\n'.join(statements * 200) + '\nend.')
+    # Те же ошибки в каждом повторе: индекс вне границ, размеры массивов, тип условия
+    broken_code = sample_code.replace('B as 1', 'V[100] as 1; W as V plus U; while A do C as true')
+
+    def best_time(function, repeat: int = 5) -> float:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    table = load_table()
+    for name, code in (('корректный текст', sample_code), ('текст с ошибками', broken_code)):
+        full = best_time(lambda: compile_source(code))
+        syntax = best_time(lambda: validate_source(code, False, table))
+        semantic = best_time(lambda: validate_source(code, True, table))
+        problems = validate_source(code, True, table)
+        print(f"{name}: разбор и анализ {full * 1000:.1f} мс, без AST: синтаксис {syntax * 1000:.1f} мс "
+              f"(в {full / syntax:.1f} раза быстрее), с семантикой {semantic * 1000:.1f} мс "
+              f"(в {full / semantic:.1f} раза быстрее); ошибок: {len(problems)}, "
+              f"при полном анализе: {len(compile_source(code).errors)}")
+        for problem in problems[:3]:
+            print(f"  {problem.describe()}")
+
+if __name__ == "__main__":
+    main()
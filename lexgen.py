@@ -0,0 +1,600 @@
+import hashlib
+import importlib.util
+import os
+import sys
+import time
+import warnings
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+#Генератор лексических анализаторов: спецификация токенов (как token_specification в lexik3.py)
+#переводится в минимальный ДКА, а ДКА - в модуль на Python со сканером для этого языка
+
+GENERATOR_VERSION = 1
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__lexcache__')
+
+ASCII = frozenset(map(chr, range(128)))
+
+# Представитель символов вне ASCII в примерах строк
+OTHER_EXAMPLE = 'é'
+
+# Сколько символов за раз пропускается по петле состояния (см. _RUNS в сгенерированном модуле)
+RUN_WINDOW = 64
+
+
+class CharSet(NamedTuple):
+    chars: frozenset  # символы ASCII
+    other: bool       # входят ли все символы вне ASCII
+
+
+DIGITS = frozenset('0123456789')
+WORD = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+SPACE = frozenset(' \t\n\r\f\v')
+
+ESCAPE_SETS = {
+    'd': CharSet(DIGITS, False), 'D': CharSet(ASCII - DIGITS, True),
+    'w': CharSet(WORD, False), 'W': CharSet(ASCII - WORD, True),
+    's': CharSet(SPACE, False), 'S': CharSet(ASCII - SPACE, True),
+}
+ESCAPE_CHARS = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v'}
+
+
+class RegexParser:
+    """
+    Разбор подмножества синтаксиса re, достаточного для спецификаций токенов:
+    символы и экранирование, классы [...], ., \\d \\w \\s, группы (...) и (?:...),
+    альтернатива |, повторения * + ? и их ленивые формы *? +? ??
+    """
+    def __init__(self, name: str, pattern: str):
+        self.name = name
+        self.pattern = pattern
+        self.pos = 0
+        self.lazy = False
+
+    def error(self, message: str):
+        raise ValueError(f"Правило {self.name}: {message} (позиция {self.pos} в {self.pattern!r})")
+
+    def peek(self) -> Optional[str]:
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def next_char(self) -> str:
+        if self.pos >= len(self.pattern):
+            self.error("неожиданный конец шаблона")
+        ch = self.pattern[self.pos]
+        self.pos += 1
+        if ch not in ASCII:
+            self.error(f"поддерживаются только символы ASCII, получен {ch!r}")
+        return ch
+
+    def parse(self):
+        node = self.alternation()
+        if self.pos != len(self.pattern):
+            self.error("лишняя закрывающая скобка")
+        return node
+
+    def alternation(self):
+        branches = [self.sequence()]
+        while self.peek() == '|':
+            self.pos += 1
+            branches.append(self.sequence())
+        return branches[0] if len(branches) == 1 else ('alt', branches)
+
+    def sequence(self):
+        items = []
+        while self.peek() not in (None, '|', ')'):
+            items.append(self.repeat())
+        return ('cat', items)
+
+    def repeat(self):
+        node = self.atom()
+        while self.peek() in ('*', '+', '?'):
+            node = (self.next_char(), node)
+            if self.peek() == '?':
+                self.pos += 1
+                self.lazy = True
+        if self.peek() == '{':
+            self.error("повторения {m,n} не поддерживаются")
+        return node
+
+    def atom(self):
+        ch = self.next_char()
+        if ch == '(':
+            if self.pattern.startswith('?:', self.pos):
+                self.pos += 2
+            elif self.peek() == '?':
+                self.error("поддерживаются только группы (...) и (?:...)")
+            node = self.alternation()
+            if self.peek() != ')':
+                self.error("не закрыта скобка")
+            self.pos += 1
+            return node
+        if ch == '[':
+            return ('set', self.char_class())
+        if ch == '.':
+            return ('set', CharSet(ASCII - {'\n'}, True))
+        if ch == '\\':
+            return ('set', self.escape())
+        if ch in '*+?':
+            self.error("нечего повторять")
+        if ch in '^$':
+            self.error("якоря ^ и $ не поддерживаются")
+        return ('set', CharSet(frozenset(ch), False))
+
+    def escape(self) -> CharSet:
+        ch = self.next_char()
+        if ch in ESCAPE_SETS:
+            return ESCAPE_SETS[ch]
+        if ch.isalnum() and ch not in ESCAPE_CHARS:
+            self.error(f"экранирование \\{ch} не поддерживается")
+        return CharSet(frozenset(ESCAPE_CHARS.get(ch, ch)), False)
+
+    def class_item(self):
+        """
+        Элемент класса символов: одиночный символ (str) или набор (CharSet) для \\d и т.п.
+        """
+        ch = self.next_char()
+        if ch != '\\':
+            return ch
+        charset = self.escape()
+        if len(charset.chars) == 1 and not charset.other:
+            return next(iter(charset.chars))
+        return charset
+
+    def char_class(self) -> CharSet:
+        negate = self.peek() == '^'
+        if negate:
+            self.pos += 1
+        chars = set()
+        other = False
+        first = True
+        while True:
+            if self.peek() == ']' and not first:
+                self.pos += 1
+                break
+            first = False
+            item = self.class_item()
+            if isinstance(item, CharSet):
+                chars |= item.chars
+                other = other or item.other
+                continue
+            if self.peek() == '-' and self.pattern[self.pos + 1:self.pos + 2] not in ('', ']'):
+                self.pos += 1
+                high = self.class_item()
+                if isinstance(high, CharSet) or high < item:
+                    self.error("некорректный диапазон в классе символов")
+                chars.update(map(chr, range(ord(item), ord(high) + 1)))
+            else:
+                chars.add(item)
+        if negate:
+            return CharSet(ASCII - chars, not other)
+        return CharSet(frozenset(chars), other)
+
+
+class NFA:
+    """
+    Недетерминированный автомат, построенный по Томпсону
+    """
+    def __init__(self):
+        self.eps: List[List[int]] = []
+        self.edges: List[List[Tuple[CharSet, int]]] = []
+        self.accept: Dict[int, int] = {}  # конечное состояние -> номер правила
+
+    def new_state(self) -> int:
+        self.eps.append([])
+        self.edges.append([])
+        return len(self.eps) - 1
+
+    def build(self, node) -> Tuple[int, int]:
+        kind = node[0]
+        start = self.new_state()
+        if kind == 'set':
+            end = self.new_state()
+            self.edges[start].append((node[1], end))
+            return start, end
+        if kind == 'cat':
+            end = start
+            for item in node[1]:
+                first, last = self.build(item)
+                self.eps[end].append(first)
+                end = last
+            return start, end
+
+        end = self.new_state()
+        if kind == 'alt':
+            for branch in node[1]:
+                first, last = self.build(branch)
+                self.eps[start].append(first)
+                self.eps[last].append(end)
+            return start, end
+
+        first, last = self.build(node[1])
+        self.eps[start].append(first)
+        if kind in ('*', '?'):
+            self.eps[start].append(end)
+        if kind in ('*', '+'):
+            self.eps[last].append(first)
+        self.eps[last].append(end)
+        return start, end
+
+    def closure(self, states) -> frozenset:
+        result = set(states)
+        stack = list(states)
+        while stack:
+            for target in self.eps[stack.pop()]:
+                if target not in result:
+                    result.add(target)
+                    stack.append(target)
+        return frozenset(result)
+
+
+class DFA(NamedTuple):
+    classes: Dict[str, int]     # символ ASCII -> класс
+    other_class: int            # класс символов вне ASCII
+    examples: List[str]         # представитель каждого класса
+    transitions: List[List[int]]
+    accepts: List[Tuple[int, ...]]  # все правила, допускающие строку состояния
+    winners: List[int]          # правило-победитель (с наименьшим номером) или -1
+
+
+def partition_alphabet(charsets: Sequence[CharSet]):
+    """
+    Разбиение алфавита на классы символов, неразличимых ни одним набором
+    """
+    signatures = {}
+    classes = {}
+    examples = []
+    for ch in sorted(ASCII):
+        signature = tuple(ch in charset.chars for charset in charsets)
+        if signature not in signatures:
+            signatures[signature] = len(examples)
+            examples.append(ch)
+        classes[ch] = signatures[signature]
+    signature = tuple(charset.other for charset in charsets)
+    if signature not in signatures:
+        signatures[signature] = len(examples)
+        examples.append(OTHER_EXAMPLE)
+    other_class = signatures[signature]
+
+    members = {}
+    for index, charset in enumerate(charsets):
+        members[charset] = frozenset(cls for signature, cls in signatures.items() if signature[index])
+    return classes, other_class, examples, members
+
+
+def build_dfa(specification: Sequence[Tuple[str, str]]) -> DFA:
+    """
+    Построение ДКА по списку (имя, шаблон); при совпадении длины
+    побеждает правило, стоящее в списке раньше
+    """
+    nfa = NFA()
+    start = nfa.new_state()
+    lazy = []
+    for index, (name, pattern) in enumerate(specification):
+        parser = RegexParser(name, pattern)
+        first, last = nfa.build(parser.parse())
+        nfa.eps[start].append(first)
+        nfa.accept[last] = index
+        lazy.append(parser.lazy)
+
+    charsets = list(dict.fromkeys(charset for edges in nfa.edges for charset, _ in edges))
+    classes, other_class, examples, members = partition_alphabet(charsets)
+
+    start_set = nfa.closure([start])
+    for state in start_set:
+        if state in nfa.accept:
+            raise ValueError(f"Правило {specification[nfa.accept[state]][0]} допускает пустую строку")
+
+    index = {start_set: 0}
+    sets = [start_set]
+    transitions, accepts, winners = [], [], []
+    for state_set in sets:
+        accepted = tuple(sorted(nfa.accept[s] for s in state_set if s in nfa.accept))
+        winner = accepted[0] if accepted else -1
+        accepts.append(accepted)
+        winners.append(winner)
+
+        row = [-1] * len(examples)
+        transitions.append(row)
+        # Для ленивого правила (.*? и т.п.) совпадение заканчивается на первом допуске
+        if winner >= 0 and lazy[winner]:
+            continue
+        buckets = {}
+        for s in state_set:
+            for charset, target in nfa.edges[s]:
+                for cls in members[charset]:
+                    buckets.setdefault(cls, set()).add(target)
+        for cls, targets in buckets.items():
+            target_set = nfa.closure(targets)
+            if target_set not in index:
+                index[target_set] = len(sets)
+                sets.append(target_set)
+            row[cls] = index[target_set]
+
+    return DFA(classes, other_class, examples, transitions, accepts, winners)
+
+
+def minimize(dfa: DFA) -> DFA:
+    """
+    Минимизация ДКА последовательным разбиением состояний (алгоритм Мура).
+    Начальное состояние минимального автомата имеет номер 0
+    """
+    blocks = {}
+    block = [blocks.setdefault(winner, len(blocks)) for winner in dfa.winners]
+    while True:
+        signatures = {}
+        refined = []
+        for state, row in enumerate(dfa.transitions):
+            signature = (block[state], tuple(block[t] if t >= 0 else -1 for t in row))
+            refined.append(signatures.setdefault(signature, len(signatures)))
+        if len(signatures) == len(set(block)):
+            break
+        block = refined
+
+    # Перенумерация: блок начального состояния получает номер 0
+    order = {}
+    for state in sorted(range(len(block)), key=lambda s: s != 0):
+        order.setdefault(block[state], len(order))
+    count = len(order)
+    transitions = [None] * count
+    accepts = [()] * count
+    winners = [-1] * count
+    for state, row in enumerate(dfa.transitions):
+        new = order[block[state]]
+        if transitions[new] is None:
+            transitions[new] = [order[block[t]] if t >= 0 else -1 for t in row]
+            accepts[new] = dfa.accepts[state]
+            winners[new] = dfa.winners[state]
+    return DFA(dfa.classes, dfa.other_class, dfa.examples, transitions, accepts, winners)
+
+
+def shortest_strings(dfa: DFA, start: int = 0) -> Dict[int, str]:
+    """
+    Кратчайшая строка, переводящая автомат из start в каждое достижимое состояние
+    """
+    paths = {start: ''}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        for cls, target in enumerate(dfa.transitions[state]):
+            if target >= 0 and target not in paths:
+                paths[target] = paths[state] + dfa.examples[cls]
+                queue.append(target)
+    return paths
+
+
+def analyze(dfa: DFA, specification: Sequence[Tuple[str, str]]) -> List[str]:
+    """
+    Поиск проблем в спецификации:
+    - правила, которые никогда не срабатывают, потому что их строки допускает правило выше;
+    - правила, которые не допускают ни одной строки после ленивых правил;
+    - пары правил, для которых поиск самого длинного совпадения и re (первая подошедшая
+      альтернатива) дают разный результат
+    """
+    names = [name for name, _ in specification]
+    paths = shortest_strings(dfa)
+    problems = []
+
+    won = set(dfa.winners)
+    for rule, name in enumerate(names):
+        if rule in won:
+            continue
+        shadowing = sorted({dfa.winners[s] for s in paths if rule in dfa.accepts[s]})
+        if shadowing:
+            example = next(paths[s] for s in paths if rule in dfa.accepts[s])
+            by = ', '.join(names[r] for r in shadowing)
+            problems.append(f"Правило {name} перекрыто правилом {by}: например, {example!r}")
+        else:
+            problems.append(f"Правило {name} недостижимо: ни одна строка не распознаётся им")
+
+    reported = set()
+    for state in paths:
+        first = dfa.winners[state]
+        if first < 0:
+            continue
+        continuations = shortest_strings(dfa, state)
+        for target, suffix in continuations.items():
+            second = dfa.winners[target]
+            if target == state or second <= first or (first, second) in reported:
+                continue
+            reported.add((first, second))
+            problems.append(
+                f"Правило {names[first]} стоит выше {names[second]} и допускает префикс его строки: "
+                f"на {paths[state] + suffix!r} re выберет {names[first]} ({paths[state]!r}), "
+                f"а сканер - самое длинное совпадение {names[second]}")
+    return problems
+
+
+def self_loop_runs(dfa: DFA) -> List[str]:
+    """
+    Для каждого состояния - символы ASCII, по которым автомат остаётся в нём же.
+    Такие участки сгенерированный сканер пропускает одним вызовом str.lstrip
+    """
+    runs = []
+    for state, row in enumerate(dfa.transitions):
+        runs.append(''.join(ch for ch, cls in sorted(dfa.classes.items()) if row[cls] == state))
+    return runs
+
+
+def emit_scanner(dfa: DFA, specification: Sequence[Tuple[str, str]], keywords: Dict[str, str],
+                 skip: Sequence[str] = (), newline: str = None, identifier: str = None,
+                 mismatch: str = None, converters: Dict[str, str] = None,
+                 problems: Sequence[str] = ()) -> str:
+    """
+    Текст модуля со сканером: таблицы автомата и функция tokenize,
+    возвращающая токены в формате lexik3.tokenize (тип, значение, строка, позиция)
+    """
+    names = [name for name, _ in specification]
+    rule = {name: index for index, name in enumerate(names)}
+    converters = converters or {}
+    nclasses = len(dfa.examples)
+    flat = [target for row in dfa.transitions for target in row]
+
+    lines = [
+        '# Сгенерировано lexgen.py, не редактировать.',
+        '# Правила:',
+    ]
+    lines += [f'#   {name}: {pattern}' for name, pattern in specification]
+    lines.append('')
+    for name, target in sorted(converters.items()):
+        module, function = target.split(':')
+        lines.append(f'from {module} import {function} as _convert_{name}')
+    lines += [
+        '',
+        f'RULES = {tuple(names)!r}',
+        f'KEYWORDS = {dict(keywords)!r}',
+        f'WARNINGS = {tuple(problems)!r}',
+        '',
+        f'_CLASS = {dict(sorted(dfa.classes.items()))!r}',
+        f'_OTHER = {dfa.other_class}',
+        f'_NCLASSES = {nclasses}',
+        f'_NEXT = {tuple(flat)!r}',
+        f'_ACCEPT = {tuple(dfa.winners)!r}',
+        f'_RUNS = {tuple(self_loop_runs(dfa))!r}',
+        '',
+        '',
+        'def tokenize(code):',
+        '    line_num = 1',
+        '    line_start = 0',
+        '    pos = 0',
+        '    n = len(code)',
+        '    get_class = _CLASS.get',
+        '    transitions = _NEXT',
+        '    accept = _ACCEPT',
+        '    runs = _RUNS',
+        '    while pos < n:',
+        '        # Самое длинное совпадение по таблицам автомата',
+        '        state = 0',
+        '        i = pos',
+        '        matched = -1',
+        '        end = pos',
+        '        while i < n:',
+        f'            state = transitions[state * {nclasses} + get_class(code[i], {dfa.other_class})]',
+        '            if state < 0:',
+        '                break',
+        '            i += 1',
+        '            run = runs[state]',
+        '            if run:',
+        f'                window = code[i:i + {RUN_WINDOW}]',
+        '                i += len(window) - len(window.lstrip(run))',
+        '            if accept[state] >= 0:',
+        '                matched = accept[state]',
+        '                end = i',
+        '        if matched < 0:',
+        "            raise RuntimeError(f'Неожиданный символ {code[pos]!r} на строке {line_num}')",
+        '        value = code[pos:end]',
+        '        column = pos - line_start',
+        '        pos = end',
+    ]
+
+    # Обработка правил: сначала самые частые (пропуски и переводы строк)
+    branch = 'if'
+    if skip:
+        ids = tuple(rule[name] for name in skip)
+        lines += [f'        {branch} matched in {ids!r}:', '            continue']
+        branch = 'elif'
+    if newline:
+        lines += [f'        {branch} matched == {rule[newline]}:',
+                  '            line_start = pos',
+                  '            line_num += 1',
+                  '            continue']
+        branch = 'elif'
+    if mismatch:
+        lines += [f'        {branch} matched == {rule[mismatch]}:',
+                  "            raise RuntimeError(f'Неожиданный символ {value!r} на строке {line_num}')"]
+        branch = 'elif'
+    kind = 'RULES[matched]'
+    if identifier:
+        lines += [f'        {branch} matched == {rule[identifier]}:',
+                  f'            yield KEYWORDS.get(value, {identifier!r}), value, line_num, column',
+                  '            continue']
+        branch = 'elif'
+    for name in converters:
+        lines += [f'        {branch} matched == {rule[name]}:',
+                  f'            yield {name!r}, _convert_{name}(value), line_num, column',
+                  '            continue']
+        branch = 'elif'
+    lines += [f'        yield {kind}, value, line_num, column', '']
+    return '\n'.join(lines)
+
+
+def generate(specification: Sequence[Tuple[str, str]], keywords: Dict[str, str] = None, **options):
+    """
+    Построение сканера: возвращает текст модуля и список найденных проблем
+    """
+    # Анализ - до минимизации: при слиянии состояний теряются проигравшие правила
+    dfa = build_dfa(specification)
+    problems = analyze(dfa, specification)
+    dfa = minimize(dfa)
+    source = emit_scanner(dfa, specification, keywords or {}, problems=problems, **options)
+    return source, problems
+
+
+def load_scanner(specification: Sequence[Tuple[str, str]], keywords: Dict[str, str] = None,
+                 name: str = 'scanner', cache_dir: str = CACHE_DIR, **options):
+    """
+    Импорт сгенерированного сканера. Модуль хранится в cache_dir под именем,
+    зависящим от спецификации, и строится заново только при её изменении.
+    Проблемы спецификации выдаются предупреждениями при построении
+    """
+    key = repr((GENERATOR_VERSION, list(specification), sorted((keywords or {}).items()),
+                sorted(options.items(), key=lambda item: item[0])))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    module_name = f'{name}_{digest}'
+    path = os.path.join(cache_dir, module_name + '.py')
+
+    if not os.path.exists(path):
+        source, problems = generate(specification, keywords, **options)
+        for problem in problems:
+            warnings.warn(problem, stacklevel=2)
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(source)
+        os.replace(temporary, path)
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+LEXIK3_OPTIONS = {
+    'skip': ('SKIP',),
+    'newline': 'NEWLINE',
+    'identifier': 'INDENT',
+    'mismatch': 'MISMATCH',
+    'converters': {'NUMBER': 'lexik3:number_value'},
+}
+
+
+def main():
+    import lexik3
+
+    scanner = load_scanner(lexik3.token_specification, lexik3.KEYWORDS, 'lexik3_scanner',
+                           **LEXIK3_OPTIONS)
+    for problem in scanner.WARNINGS:
+        print(f"Предупреждение: {problem}")
+    print(f"Сканер: {scanner.__file__}, состояний: {len(scanner._ACCEPT)}, классов символов: {scanner._NCLASSES}")
+
+    with open('input.txt') as file:
+        code = file.read() * 2000
+
+    timings = {}
+    for label, tokenize in (('re', lambda text: lexik3.tokenize(text, scan_numbers=False)),
+                            ('ДКА', scanner.tokenize)):
+        best = None
+        for _ in range(5):
+            start = time.perf_counter()
+            tokens = list(tokenize(code))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[label] = (tokens, best)
+        print(f"{label}: {len(tokens)} токенов, {best:.3f} с")
+
+    if timings['re'][0] != timings['ДКА'][0]:
+        print("Результаты сканеров различаются")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import re
+import sys
+import time
 #не рассматривать в качестве регулярных выражений -> рассматривать в качестве состояний
 #В качетсве регулярных выражений можно проверять состояния буферов и тп
 # Список ключевых слов
@@ -21,11 +23,181 @@ KEYWORDS = {
     'step':'STEP'
 }
 
+# Алфавиты числовых литералов (см. obrabot.txt).
+# Каждому символу сопоставляется битовая маска классов, к которым он относится,
+# поэтому при разборе числа вместо проверок вхождения в списки Bin_num, Oct_num и т.д.
+# выполняется одно обращение к таблице и одна операция &.
+BIN = 1           # двоичная цифра
+OCT = 2           # восьмеричная цифра
+DEC = 4           # десятичная цифра
+HEX = 8           # шестнадцатеричная цифра
+BIN_SUFFIX = 16   # B, b
+OCT_SUFFIX = 32   # O, o
+DEC_SUFFIX = 64   # D, d
+HEX_SUFFIX = 128  # H, h
+EXP = 256         # E, e - порядок действительного числа
+DOT = 512         # .
+SIGN = 1024       # +, - в порядке
+
+DIGIT_CLASSES = BIN | OCT | DEC | HEX
+SUFFIX_CLASSES = BIN_SUFFIX | OCT_SUFFIX | DEC_SUFFIX | HEX_SUFFIX
+
+NUMBER_FORMS = (
+    # (форма, цифры, бит цифр, суффикс, бит суффикса, основание)
+    ('BIN', '01', BIN, 'Bb', BIN_SUFFIX, 2),
+    ('OCT', '01234567', OCT, 'Oo', OCT_SUFFIX, 8),
+    ('DEC', '0123456789', DEC, 'Dd', DEC_SUFFIX, 10),
+    ('HEX', '0123456789ABCDEFabcdef', HEX, 'Hh', HEX_SUFFIX, 16),
+)
+
+
+def build_char_classes():
+    """
+    Построение таблицы символ -> битовая маска классов
+    """
+    classes = {}
+    for _, digits, digit_bit, suffix, suffix_bit, _ in NUMBER_FORMS:
+        for ch in digits:
+            classes[ch] = classes.get(ch, 0) | digit_bit
+        for ch in suffix:
+            classes[ch] = classes.get(ch, 0) | suffix_bit
+    for chars, bit in (('Ee', EXP), ('.', DOT), ('+-', SIGN)):
+        for ch in chars:
+            classes[ch] = classes.get(ch, 0) | bit
+    return classes
+
+
+CHAR_CLASS = build_char_classes()
+
+DECIMAL_DIGITS = '0123456789'
+
+# Основания систем счисления для форм с суффиксом
+NUMBER_BASES = {form: base for form, _, _, _, _, base in NUMBER_FORMS}
+
+
+def _scan_real(code, i, n, get):
+    """
+    Разбор дробной части и порядка действительного числа.
+    В позиции i стоит '.' или 'E'; возвращается конец литерала
+    или i, если продолжения, образующего действительное число, нет.
+    """
+    j = i
+    if get(code[j], 0) & DOT:
+        j += 1
+        start = j
+        while j < n and get(code[j], 0) & DEC:
+            j += 1
+        if j == start:
+            return i
+        if j == n or not get(code[j], 0) & EXP:
+            return j
+    # Порядок: E [+|-] <числовая строка>
+    end = j if j > i else i
+    k = j + 1
+    if k < n and get(code[k], 0) & SIGN:
+        k += 1
+    start = k
+    while k < n and get(code[k], 0) & DEC:
+        k += 1
+    return k if k > start else end
+
+
+def scan_number(code, pos):
+    """
+    Разбор числового литерала, начинающегося с цифры в позиции pos.
+
+    Все формы (двоичная, восьмеричная, десятичная, шестнадцатеричная и действительная)
+    проверяются за один проход: маска alive хранит формы, цифрам которых соответствует
+    уже прочитанная часть, и сужается по таблице CHAR_CLASS на каждом символе.
+    Из всех допустимых вариантов выбирается самый длинный, поэтому 1Bh - это
+    шестнадцатеричное 1B, а 12E3 - действительное 12000.0.
+    Возвращает (форма, значение, позиция конца литерала).
+    """
+    get = CHAR_CLASS.get
+    n = len(code)
+
+    # Быстрый путь: десятичная строка, за которой идёт символ вне всех классов
+    window = code[pos:pos + 32]
+    digits = window.lstrip(DECIMAL_DIGITS)
+    if digits and not get(digits[0], 0):
+        end = pos + len(window) - len(digits)
+        return 'DEC', int(code[pos:end]), end
+
+    alive = DIGIT_CLASSES
+    best_end = pos
+    best_form = None
+    i = pos
+    while i < n:
+        cls = get(code[i], 0)
+        if alive & DEC:
+            # Прочитанная часть - десятичная строка без суффикса
+            if i > best_end:
+                best_end, best_form = i, 'DEC'
+            if cls & (DOT | EXP):
+                end = _scan_real(code, i, n, get)
+                if end > best_end:
+                    best_end, best_form = end, 'REAL'
+        if cls & SUFFIX_CLASSES and i + 1 > best_end:
+            if cls & HEX_SUFFIX and alive & HEX:
+                best_end, best_form = i + 1, 'HEX'
+            elif cls & DEC_SUFFIX and alive & DEC:
+                best_end, best_form = i + 1, 'DEC'
+            elif cls & BIN_SUFFIX and alive & BIN:
+                best_end, best_form = i + 1, 'BIN'
+            elif cls & OCT_SUFFIX and alive & OCT:
+                best_end, best_form = i + 1, 'OCT'
+        alive &= cls
+        if not alive:
+            break
+        i += 1
+    else:
+        if alive & DEC and n > best_end:
+            best_end, best_form = n, 'DEC'
+
+    text = code[pos:best_end]
+    if best_form == 'REAL':
+        value = float(text)
+    elif get(text[-1], 0) & SUFFIX_CLASSES:
+        value = int(text[:-1], NUMBER_BASES[best_form])
+    else:
+        value = int(text)
+    return best_form, value, best_end
+
+
+def number_value(text):
+    """
+    Преобразование текста литерала, найденного регулярным выражением, в число
+    """
+    last = text[-1]
+    if last in 'Hh':
+        return int(text[:-1], 16)
+    if last in 'Bb':
+        return int(text[:-1], 2)
+    if last in 'Oo':
+        return int(text[:-1], 8)
+    if last in 'Dd':
+        return int(text[:-1])
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+    return int(text)
+
+
+# Те же формы одним регулярным выражением; порядок альтернатив подобран так,
+# чтобы первая подошедшая альтернатива была и самой длинной.
+NUMBER_PATTERN = (
+    r'[0-9][0-9A-Fa-f]*[Hh]'
+    r'|[0-9]+(?:\.[0-9]+)?[Ee][+-]?[0-9]+'
+    r'|[0-9]+\.[0-9]+'
+    r'|[01]+[Bb]'
+    r'|[0-7]+[Oo]'
+    r'|[0-9]+[Dd]?'
+)
+
 token_specification = [
     # Операторы:
     ('NEQ', r'!='),
     ('EQ', r'=='),
-    ('LE', r'>='),
+    ('LE', r'<='),
     ('GE', r'>='),
     ('LT', r'<'),
     ('GT', r'>'),
@@ -39,7 +211,7 @@ token_specification = [
     ('OST', r'%'),
 
     # Литералы:
-    ('NUMBER', r'\d+(\.\d+)?'),  # Число (целое или с плавающей точкой)
+    ('NUMBER', NUMBER_PATTERN),  # Число: двоичное, восьмеричное, десятичное, шестнадцатеричное, действительное
     ('INDENT', r'[A-Za-z_][A-Za-z0-9_]*'),  # Идентификаторы
 
     # Прочие токены:
@@ -56,16 +228,35 @@ token_specification = [
 token_re = re.compile('|'.join('(?P<%s>%s)' % pair for pair in token_specification))
 
 
-def tokenize(code):
+def tokenize(code, scan_numbers=False):
+    """
+    Разбиение текста на токены.
+    Числовые литералы по умолчанию разбираются альтернативой NUMBER общего регулярного
+    выражения; при scan_numbers=True - функцией scan_number по таблице классов символов.
+    Таблица даёт тот же результат, но медленнее: цикл по символам на Python проигрывает
+    одному сопоставлению регулярного выражения (см. python lexik3.py --bench)
+    """
     line_num = 1
     line_start = 0
-    for mo in token_re.finditer(code):
+    pos = 0
+    end = len(code)
+    match = token_re.match
+    get = CHAR_CLASS.get
+    while pos < end:
+        if scan_numbers and get(code[pos], 0) & DEC:
+            _, value, stop = scan_number(code, pos)
+            yield 'NUMBER', value, line_num, pos - line_start
+            pos = stop
+            continue
+
+        mo = match(code, pos)
         kind = mo.lastgroup#Название группы, к которой отнеслось часть выражения
         value = mo.group()
+        pos = mo.end()
 
         if kind == 'NUMBER':
             # Преобразуем строку числа в число (int или float)
-            value = float(value) if '.' in value else int(value)
+            value = number_value(value)
 
         elif kind == 'INDENT':
             # Проверяем, не является ли идентификатор ключевым словом
@@ -74,7 +265,7 @@ def tokenize(code):
 
         elif kind == 'NEWLINE':
             # Подсчёт строк
-            line_start = mo.end()
+            line_start = pos
             line_num += 1
             continue
 
@@ -90,17 +281,47 @@ def tokenize(code):
         yield kind, value, line_num, mo.start() - line_start
 
 
+def benchmark_numbers(lines=20000, repeat=5):
+    """
+    Сравнение разбора числовых литералов по таблице классов
+    и альтернативой регулярного выражения на тексте из одних литералов;
+    печатает лучшее время каждого способа и их отношение
+    """
+    literals = ['0', '72', '101b', '777o', '129d', '1Bh', '0FFh', '12E3h',
+                '3.14', '12E3', '1.5e-7', '6.02E+23', '1B', '19', '1D']
+    code = '\n'.join(' '.join(literals) for _ in range(lines))
+
+    results = {}
+    timings = {}
+    for name, scan_numbers in (('table', True), ('regex', False)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            tokens = list(tokenize(code, scan_numbers))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = tokens
+        timings[name] = best
+        print(f"{name}: {len(tokens)} токенов, {best:.3f} с")
+
+    if results['table'] != results['regex']:
+        raise RuntimeError('Результаты разбора чисел различаются')
+    print(f"таблица / регулярное выражение: {timings['table'] / timings['regex']:.2f}")
 
 
+if __name__ == "__main__":
+    if sys.argv[1:] == ['--bench']:
+        benchmark_numbers()
+        sys.exit()
 
-f = open("input.txt").readlines()
-code = ""
-for i in range(len(f)):
-    code+=str(f[i])
-fe = open("output.txt", "w")
-try:
-    for token in tokenize(code):
-        print(token)
-        fe.write(str(token) + '\n')
-except ValueError as e:
-    print(f"Error: {e}")
\ No newline at end of file
+    f = open("input.txt").readlines()
+    code = ""
+    for i in range(len(f)):
+        code+=str(f[i])
+    fe = open("output.txt", "w")
+    try:
+        for token in tokenize(code):
+            print(token)
+            fe.write(str(token) + '\n')
+    except ValueError as e:
+        print(f"Error: {e}")